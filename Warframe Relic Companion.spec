@@ -10,6 +10,7 @@ datas = [
     ('icon_manager.py', '.'),
     ('models.py', '.'),
     ('relic_data.py', '.'),
+    ('ui_fonts.py', '.'),
 ]
 binaries = []
 hiddenimports = ['customtkinter', 'PIL', 'PIL._tkinter_finder', 'requests', 'updater']
@@ -11,6 +11,10 @@ if %errorlevel% neq 0 (
     pip install pyinstaller
 )
 
+echo.
+echo Pre-building mastery rank badges...
+python -c "from icon_manager import prebuild_mastery_badges; prebuild_mastery_badges()"
+
 echo.
 echo Building EXE...
 pyinstaller "Warframe Relic Companion.spec" --noconfirm
@@ -164,6 +164,8 @@ class RelicDatabase:
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_rewards_relic ON rewards(relic_id)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_inventory_relic ON inventory(relic_id)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_history_timestamp ON relic_history(timestamp)')
+        # Serves the filtered history query: WHERE action = ? ORDER BY timestamp DESC LIMIT ?
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_history_action_ts ON relic_history(action, timestamp DESC)')
         
         self.conn.commit()
     
@@ -335,21 +337,21 @@ class RelicDatabase:
         """Save entire inventory efficiently."""
         cursor = self.conn.cursor()
         
+        # Resolve relic ids up front so the rows go in with one executemany
+        rows = [
+            (self._get_or_create_relic_id(item.relic), item.refinement.value, item.quantity)
+            for item in inventory if item.relic
+        ]
+        
         # Clear existing inventory
         cursor.execute('DELETE FROM inventory')
         
-        for item in inventory:
-            if not item.relic:
-                continue
-                
-            relic_id = self._get_or_create_relic_id(item.relic)
-            
-            cursor.execute('''
-                INSERT INTO inventory (relic_id, refinement, quantity)
-                VALUES (?, ?, ?)
-                ON CONFLICT(relic_id, refinement) DO UPDATE SET
-                    quantity = excluded.quantity
-            ''', (relic_id, item.refinement.value, item.quantity))
+        cursor.executemany('''
+            INSERT INTO inventory (relic_id, refinement, quantity)
+            VALUES (?, ?, ?)
+            ON CONFLICT(relic_id, refinement) DO UPDATE SET
+                quantity = excluded.quantity
+        ''', rows)
         
         self.conn.commit()
     
@@ -571,30 +573,41 @@ class RelicDatabase:
         self.conn.commit()
         return cursor.lastrowid
     
-    def get_run_history(self, limit: int = 50) -> list[dict]:
-        """Get run history, newest first."""
-        import json
+    def get_run_history(self, limit: int = 50, offset: int = 0) -> list[dict]:
+        """Get run history, newest first. offset skips that many of the newest runs (for paging)."""
         cursor = self.conn.cursor()
         
         cursor.execute('''
-            SELECT * FROM run_history ORDER BY id DESC LIMIT ?
-        ''', (limit,))
+            SELECT * FROM run_history ORDER BY id DESC LIMIT ? OFFSET ?
+        ''', (limit, offset))
         
-        runs = []
-        for row in cursor.fetchall():
-            runs.append({
-                'id': row['id'],
-                'title': row['title'],
-                'date': row['date'],
-                'total_plat': row['total_plat'],
-                'total_ducats': row['total_ducats'],
-                'total_items': row['total_items'],
-                'gold': row['gold'],
-                'silver': row['silver'],
-                'bronze': row['bronze'],
-                'rewards': json.loads(row['rewards_json']) if row['rewards_json'] else []
-            })
-        return runs
+        return [self._row_to_run(row) for row in cursor.fetchall()]
+    
+    def get_run_history_since(self, last_id: int) -> list[dict]:
+        """Get runs saved after the run with id last_id, newest first."""
+        cursor = self.conn.cursor()
+        
+        cursor.execute('''
+            SELECT * FROM run_history WHERE id > ? ORDER BY id DESC
+        ''', (last_id,))
+        
+        return [self._row_to_run(row) for row in cursor.fetchall()]
+    
+    def _row_to_run(self, row: sqlite3.Row) -> dict:
+        """Convert a run_history row to a run dict."""
+        import json
+        return {
+            'id': row['id'],
+            'title': row['title'],
+            'date': row['date'],
+            'total_plat': row['total_plat'],
+            'total_ducats': row['total_ducats'],
+            'total_items': row['total_items'],
+            'gold': row['gold'],
+            'silver': row['silver'],
+            'bronze': row['bronze'],
+            'rewards': json.loads(row['rewards_json']) if row['rewards_json'] else []
+        }
     
     def delete_run(self, run_id: int):
         """Delete a run from history."""
@@ -7,6 +7,7 @@ Also creates custom mastery rank badges.
 import os
 import sys
 import math
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
 from io import BytesIO
 
@@ -16,6 +17,9 @@ try:
 except ImportError:
     HAS_REQUESTS = False
 
+# Cached icons are tiny and re-read by Pillow, so favour encode speed over size
+PNG_COMPRESS_LEVEL = 1
+
 
 def get_icons_dir() -> str:
     """Get the icons directory path."""
@@ -31,6 +35,15 @@ def get_icons_dir() -> str:
     return icons_dir
 
 
+def _to_rgba(img: Image.Image) -> Image.Image:
+    """Return the image in RGBA mode, only converting when it isn't already."""
+    img.load()  # Make sure the mode reflects the decoded data
+    if img.mode == 'RGBA':
+        return img
+    # Icons are flat colours, so dithering would only cost time
+    return img.convert('RGBA', dither=Image.Dither.NONE)
+
+
 def create_hexagon_points(cx: int, cy: int, radius: int) -> list:
     """Create points for a hexagon centered at (cx, cy)."""
     points = []
@@ -42,6 +55,39 @@ def create_hexagon_points(cx: int, cy: int, radius: int) -> list:
     return points
 
 
+@lru_cache(maxsize=None)
+def _hexagon_masks(size: int) -> tuple:
+    """
+    Build the (outer, inner) hexagon masks for a mastery badge of this size.
+    
+    The shape only depends on the size, so it is rasterized once and shared
+    by every rank.
+    """
+    cx, cy = size // 2, size // 2
+    outer_radius = size // 2 - 2
+    inner_radius = outer_radius - 3
+    
+    outer = Image.new('L', (size, size), 0)
+    ImageDraw.Draw(outer).polygon(create_hexagon_points(cx, cy, outer_radius), fill=255)
+    
+    inner = Image.new('L', (size, size), 0)
+    ImageDraw.Draw(inner).polygon(create_hexagon_points(cx, cy, inner_radius), fill=255)
+    
+    return outer, inner
+
+
+@lru_cache(maxsize=None)
+def _badge_font(font_size: int):
+    """Load the badge font for a size, falling back to the default font."""
+    try:
+        return ImageFont.truetype("segoeui.ttf", font_size)
+    except:
+        try:
+            return ImageFont.truetype("arial.ttf", font_size)
+        except:
+            return ImageFont.load_default()
+
+
 def create_mastery_badge(rank: int, size: int = 50) -> Image.Image:
     """
     Create a custom mastery rank badge as a hexagon.
@@ -54,11 +100,8 @@ def create_mastery_badge(rank: int, size: int = 50) -> Image.Image:
     """
     # Create image with transparency
     img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
     
     cx, cy = size // 2, size // 2
-    outer_radius = size // 2 - 2
-    inner_radius = outer_radius - 3
     
     # Determine colors based on rank
     if rank >= 30:
@@ -82,24 +125,15 @@ def create_mastery_badge(rank: int, size: int = 50) -> Image.Image:
         inner_color = (30, 30, 40)
         text_color = (220, 220, 220)
     
-    # Draw outer hexagon (border)
-    outer_points = create_hexagon_points(cx, cy, outer_radius)
-    draw.polygon(outer_points, fill=outer_color)
-    
-    # Draw inner hexagon (fill)
-    inner_points = create_hexagon_points(cx, cy, inner_radius)
-    draw.polygon(inner_points, fill=inner_color)
+    # Outer hexagon (border) then inner hexagon (fill)
+    outer_mask, inner_mask = _hexagon_masks(size)
+    img.paste(outer_color, mask=outer_mask)
+    img.paste(inner_color, mask=inner_mask)
     
     # Draw the rank number
-    # Try to use a bold font, fall back to default
+    draw = ImageDraw.Draw(img)
     font_size = size // 3 if rank < 10 else size // 4
-    try:
-        font = ImageFont.truetype("segoeui.ttf", font_size)
-    except:
-        try:
-            font = ImageFont.truetype("arial.ttf", font_size)
-        except:
-            font = ImageFont.load_default()
+    font = _badge_font(font_size)
     
     text = str(rank)
     
@@ -140,21 +174,36 @@ def get_mastery_icon_path(rank: int, size: int = 50) -> str:
     if os.path.exists(original_path):
         try:
             img = Image.open(original_path)
-            if img.mode != 'RGBA':
-                img = img.convert('RGBA')
+            img = _to_rgba(img)
             img = img.resize((size, size), Image.Resampling.LANCZOS)
-            img.save(sized_path, 'PNG')
+            img.save(sized_path, 'PNG', compress_level=PNG_COMPRESS_LEVEL)
             return sized_path
         except Exception as e:
             print(f"Error resizing mastery icon: {e}")
     
     # Fall back to custom hexagon badge
     img = create_mastery_badge(rank, size)
-    img.save(sized_path, 'PNG')
+    img.save(sized_path, 'PNG', compress_level=PNG_COMPRESS_LEVEL)
     
     return sized_path
 
 
+def prebuild_mastery_badges(sizes: tuple = (44,)) -> list[str]:
+    """
+    Generate the cached mastery rank icons for every rank up front.
+    
+    Meant to be run once at build time so the shipped icons folder already
+    contains every sized badge and the app never has to resize at runtime.
+    
+    Args:
+        sizes: Icon sizes to build (44 is the sidebar badge)
+        
+    Returns:
+        Paths of the generated icons
+    """
+    return [get_mastery_icon_path(rank, size) for size in sizes for rank in range(35)]
+
+
 def download_icon(url: str, save_path: str, size: tuple = None) -> bool:
     """Download an icon from URL and optionally resize it."""
     if not HAS_REQUESTS:
@@ -166,51 +215,62 @@ def download_icon(url: str, save_path: str, size: tuple = None) -> bool:
         })
         response.raise_for_status()
         
+        # Pillow buffers a non-seekable stream in memory anyway, so just decode the body
         img = Image.open(BytesIO(response.content))
-        if img.mode != 'RGBA':
-            img = img.convert('RGBA')
+        if size:
+            # Let JPEG sources decode straight to near the target size (no-op for PNG)
+            img.draft(None, size)
+        img = _to_rgba(img)
         if size:
             img = img.resize(size, Image.Resampling.LANCZOS)
-        img.save(save_path, 'PNG')
+        img.save(save_path, 'PNG', compress_level=PNG_COMPRESS_LEVEL)
         return True
     except Exception as e:
         print(f"Failed to download icon: {e}")
         return False
 
 
+@lru_cache(maxsize=None)
+def _diamond_masks(size: int) -> tuple:
+    """
+    Build the shared diamond masks used by the currency icons.
+    
+    Returns (body, outline, highlight) 'L' masks. Only the size and colors
+    differ between icons, so each size is rasterized once and reused.
+    """
+    cx, cy = size // 2, size // 2
+    r = size // 2 - 2
+    inner_r = r // 2
+    
+    # Diamond points (rotated square): top, right, bottom, left
+    points = [(cx, cy - r), (cx + r, cy), (cx, cy + r), (cx - r, cy)]
+    inner_points = [(cx, cy - inner_r), (cx + inner_r, cy), (cx, cy + inner_r), (cx - inner_r, cy)]
+    
+    body = Image.new('L', (size, size), 0)
+    ImageDraw.Draw(body).polygon(points, fill=255)
+    
+    outline = Image.new('L', (size, size), 0)
+    ImageDraw.Draw(outline).polygon(points, outline=255)
+    
+    highlight = Image.new('L', (size, size), 0)
+    ImageDraw.Draw(highlight).polygon(inner_points, fill=255)
+    
+    return body, outline, highlight
+
+
 def create_platinum_icon(size: int = 20) -> Image.Image:
     """Create a simple platinum gem icon."""
     img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+    body, outline, highlight = _diamond_masks(size)
     
     # Platinum colors
     light_plat = (200, 220, 255)
     dark_plat = (100, 150, 200)
     
-    # Draw a simple diamond/gem shape
-    cx, cy = size // 2, size // 2
-    r = size // 2 - 2
-    
-    # Diamond points
-    points = [
-        (cx, cy - r),           # Top
-        (cx + r, cy),           # Right
-        (cx, cy + r),           # Bottom
-        (cx - r, cy),           # Left
-    ]
-    
-    # Draw main shape
-    draw.polygon(points, fill=light_plat, outline=dark_plat)
-    
-    # Add a center highlight
-    inner_r = r // 2
-    inner_points = [
-        (cx, cy - inner_r),
-        (cx + inner_r, cy),
-        (cx, cy + inner_r),
-        (cx - inner_r, cy),
-    ]
-    draw.polygon(inner_points, fill=(230, 240, 255))
+    # Main shape with a center highlight
+    img.paste(light_plat, mask=body)
+    img.paste(dark_plat, mask=outline)
+    img.paste((230, 240, 255), mask=highlight)
     
     return img
 
@@ -228,10 +288,9 @@ def get_platinum_icon_path(size: int = 20) -> str:
     if os.path.exists(original_path):
         try:
             img = Image.open(original_path)
-            if img.mode != 'RGBA':
-                img = img.convert('RGBA')
+            img = _to_rgba(img)
             img = img.resize((size, size), Image.Resampling.LANCZOS)
-            img.save(icon_path, 'PNG')
+            img.save(icon_path, 'PNG', compress_level=PNG_COMPRESS_LEVEL)
             return icon_path
         except Exception as e:
             print(f"Error resizing platinum icon: {e}")
@@ -243,7 +302,7 @@ def get_platinum_icon_path(size: int = 20) -> str:
     
     # Fall back to creating our own
     img = create_platinum_icon(size)
-    img.save(icon_path, 'PNG')
+    img.save(icon_path, 'PNG', compress_level=PNG_COMPRESS_LEVEL)
     return icon_path
 
 
@@ -260,10 +319,9 @@ def get_credits_icon_path(size: int = 20) -> str:
     if os.path.exists(original_path):
         try:
             img = Image.open(original_path)
-            if img.mode != 'RGBA':
-                img = img.convert('RGBA')
+            img = _to_rgba(img)
             img = img.resize((size, size), Image.Resampling.LANCZOS)
-            img.save(icon_path, 'PNG')
+            img.save(icon_path, 'PNG', compress_level=PNG_COMPRESS_LEVEL)
             return icon_path
         except Exception as e:
             print(f"Error resizing credits icon: {e}")
@@ -275,7 +333,7 @@ def get_credits_icon_path(size: int = 20) -> str:
     
     # Fall back to creating a simple credits icon
     img = create_credits_icon(size)
-    img.save(icon_path, 'PNG')
+    img.save(icon_path, 'PNG', compress_level=PNG_COMPRESS_LEVEL)
     return icon_path
 
 
@@ -309,10 +367,9 @@ def get_ducats_icon_path(size: int = 20) -> str:
     if os.path.exists(original_path):
         try:
             img = Image.open(original_path)
-            if img.mode != 'RGBA':
-                img = img.convert('RGBA')
+            img = _to_rgba(img)
             img = img.resize((size, size), Image.Resampling.LANCZOS)
-            img.save(icon_path, 'PNG')
+            img.save(icon_path, 'PNG', compress_level=PNG_COMPRESS_LEVEL)
             return icon_path
         except Exception as e:
             print(f"Error resizing ducats icon: {e}")
@@ -324,31 +381,21 @@ def get_ducats_icon_path(size: int = 20) -> str:
     
     # Fall back to creating a simple ducats icon
     img = create_ducats_icon(size)
-    img.save(icon_path, 'PNG')
+    img.save(icon_path, 'PNG', compress_level=PNG_COMPRESS_LEVEL)
     return icon_path
 
 
 def create_ducats_icon(size: int = 20) -> Image.Image:
     """Create a simple ducats icon fallback (golden diamond)."""
     img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+    body, outline, _ = _diamond_masks(size)
     
     # Orokin gold/bronze colors
     outer_color = (205, 133, 63)   # Bronze
     inner_color = (255, 215, 0)    # Gold
     
-    cx, cy = size // 2, size // 2
-    r = size // 2 - 2
-    
-    # Diamond points (rotated square)
-    points = [
-        (cx, cy - r),     # Top
-        (cx + r, cy),     # Right
-        (cx, cy + r),     # Bottom
-        (cx - r, cy),     # Left
-    ]
-    
-    draw.polygon(points, fill=inner_color, outline=outer_color)
+    img.paste(inner_color, mask=body)
+    img.paste(outer_color, mask=outline)
     
     return img
 
@@ -2,6 +2,7 @@
 Data models for Warframe Relic Companion
 """
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
@@ -54,8 +55,20 @@ DROP_CHANCES = {
     }
 }
 
+# Flattened (refinement, rarity) -> chance table so lookups cost a single hash
+_DROP_TABLE = {
+    (refinement, rarity): chance
+    for refinement, chances in DROP_CHANCES.items()
+    for rarity, chance in chances.items()
+}
 
-@dataclass
+
+def drop_chances_for(rewards: list["Reward"], refinement: RelicRefinement) -> list[float]:
+    """Return the drop chance of each reward at a refinement level, in order."""
+    return [_DROP_TABLE[refinement, reward.rarity] for reward in rewards]
+
+
+@dataclass(frozen=True, slots=True)
 class Reward:
     """Represents a single reward from a relic."""
     name: str
@@ -67,35 +80,36 @@ class Reward:
         return f"{self.name} ({self.rarity.value}) - {self.ducats} Ducats"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Relic:
     """Represents a Void Relic."""
     era: RelicEra
     name: str
-    rewards: list[Reward] = field(default_factory=list)
+    rewards: tuple[Reward, ...] = ()
     vaulted: bool = False
+    # Full relic name (e.g., 'Lith A1'), computed once per relic
+    full_name: str = field(init=False, repr=False, compare=False)
     
-    @property
-    def full_name(self) -> str:
-        """Returns the full relic name (e.g., 'Lith A1')."""
-        return f"{self.era.value} {self.name}"
+    def __post_init__(self):
+        # Frozen, so set derived/normalised fields through object.__setattr__
+        object.__setattr__(self, 'rewards', tuple(self.rewards))
+        object.__setattr__(self, 'full_name', sys.intern(f"{self.era.value} {self.name}"))
     
     def get_common_rewards(self) -> list[Reward]:
         """Returns all common rewards."""
-        return [r for r in self.rewards if r.rarity == RewardRarity.COMMON]
+        return [r for r in self.rewards if r.rarity is RewardRarity.COMMON]
     
     def get_uncommon_rewards(self) -> list[Reward]:
         """Returns all uncommon rewards."""
-        return [r for r in self.rewards if r.rarity == RewardRarity.UNCOMMON]
+        return [r for r in self.rewards if r.rarity is RewardRarity.UNCOMMON]
     
     def get_rare_reward(self) -> Optional[Reward]:
         """Returns the rare reward if it exists."""
-        rare_rewards = [r for r in self.rewards if r.rarity == RewardRarity.RARE]
-        return rare_rewards[0] if rare_rewards else None
+        return next((r for r in self.rewards if r.rarity is RewardRarity.RARE), None)
     
     def get_drop_chance(self, reward: Reward, refinement: RelicRefinement) -> float:
         """Calculate drop chance for a specific reward at a refinement level."""
-        return DROP_CHANCES[refinement][reward.rarity]
+        return _DROP_TABLE[refinement, reward.rarity]
     
     def __str__(self):
         status = " [VAULTED]" if self.vaulted else ""
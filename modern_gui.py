@@ -5,9 +5,18 @@ A sleek 2026 interface using CustomTkinter
 
 import customtkinter as ctk
 import json
+import logging
 import os
+import queue
 import re
 import threading
+import time
+import webbrowser
+from collections import defaultdict
+from concurrent.futures import Future
+from datetime import date
+from functools import lru_cache, partial
+from types import MappingProxyType
 from PIL import Image
 
 from models import (
@@ -19,46 +28,151 @@ from api import WarframeMarketAPI, PriceData
 from api import AlecaFrameAPI, AlecaFrameProfile
 from database import RelicDatabase, get_db_dir
 from icon_manager import get_mastery_icon_path, get_platinum_icon_path, get_credits_icon_path, get_ducats_icon_path
+from ui_fonts import get_font as _font
 
 # Import tab modules
 from tabs import PricesTab, InventoryTab, VoidCascadeTab, HistoryTab, VoidRelicsTab
 
+logger = logging.getLogger("relic")
+
+COLORS = MappingProxyType({
+    'bg_primary': '#0a0a0a',
+    'bg_secondary': '#141414',
+    'bg_card': '#1e1e1e',
+    'bg_hover': '#2a2a2a',
+    'accent': '#8b5cf6',
+    'accent_hover': '#a78bfa',
+    'accent_dim': '#7c3aed',
+    'success': '#22c55e',
+    'warning': '#f59e0b',
+    'error': '#ef4444',
+    'text': '#ffffff',
+    'text_secondary': '#a1a1aa',
+    'text_muted': '#71717a',
+    'gold': '#fbbf24',
+    'platinum': '#60a5fa',
+    'border': '#2a2a2a',
+})
+
+# Fun custom titles for specific users (case-insensitive)
+CUSTOM_TITLES = {
+    'itsveilor': ('twitch.tv/ItsVeilor', "#9146FF"),
+    'weeyins': ('The Creator', "#bda000"),
+    'barohunter': ('🪙 Ducat Daddy', '#fbbf24'),
+    'formafarm': ('⚡ Forma Fiend', '#60a5fa'),
+    'primepapi': ('💎 Prime Papi', '#22c55e'),
+    # Add more custom titles here!
+}
+# Normalise keys once; usernames outside the key length range can't match
+_CUSTOM_TITLES_CF = {name.casefold(): title for name, title in CUSTOM_TITLES.items()}
+_CUSTOM_TITLE_MIN_LEN = min(map(len, _CUSTOM_TITLES_CF))
+_CUSTOM_TITLE_MAX_LEN = max(map(len, _CUSTOM_TITLES_CF))
+
+
 # Set appearance mode and default color theme
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+# How long a successful "Check for Updates" result is reused
+UPDATE_CHECK_CACHE_SECONDS = 600
+
+# Pulls the token out of a pasted AlecaFrame stats URL
+_ALECA_TOKEN_RE = re.compile(r'[?&]token=([^&]+)')
+
+# AlecaFrame era/refinement strings -> enums
+_ERA_MAP = {
+    'Lith': RelicEra.LITH,
+    'Meso': RelicEra.MESO,
+    'Neo': RelicEra.NEO,
+    'Axi': RelicEra.AXI
+}
+_REF_MAP = {
+    'Intact': RelicRefinement.INTACT,
+    'Exceptional': RelicRefinement.EXCEPTIONAL,
+    'Flawless': RelicRefinement.FLAWLESS,
+    'Radiant': RelicRefinement.RADIANT
+}
+
+
+class _DaemonWorker:
+    """One daemon thread running submitted calls in order, returning futures.
+    
+    Unlike ThreadPoolExecutor, its thread never holds the process open at exit, so closing
+    the window mid-sync doesn't wait for the HTTP request to time out.
+    """
+    
+    def __init__(self, name: str):
+        self._tasks = queue.Queue()
+        threading.Thread(target=self._run, name=name, daemon=True).start()
+    
+    def submit(self, fn, *args) -> Future:
+        future = Future()
+        self._tasks.put((future, fn, args))
+        return future
+    
+    def shutdown(self):
+        """Cancel queued calls and stop the thread once its current call (if any) returns."""
+        try:
+            while True:
+                task = self._tasks.get_nowait()
+                if task:
+                    task[0].cancel()
+        except queue.Empty:
+            pass
+        self._tasks.put(None)
+    
+    def _run(self):
+        while (task := self._tasks.get()) is not None:
+            future, fn, args = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+
+@lru_cache(maxsize=64)
+def _load_ctk_image(path: str, size: int) -> ctk.CTkImage:
+    """Load an icon as a square CTkImage, reusing it for repeat requests."""
+    pil = Image.open(path)
+    # Shrink once up front with a cheap filter; these icons are tiny either way
+    pil.thumbnail((size, size), Image.Resampling.NEAREST)
+    return ctk.CTkImage(light_image=pil, dark_image=pil, size=(size, size))
+
+
+_MONTH_ABBR = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+               "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+@lru_cache(maxsize=8)
+def _format_sync_time(iso_str: str, today_iso: str) -> str:
+    """Format a sync timestamp as "2:30 PM" (today) or "Jan 31, 2:30 PM"."""
+    # Slice the ISO string directly rather than building a datetime
+    month = iso_str[5:7]
+    if len(iso_str) < 16 or iso_str[10] not in "T " or not iso_str[11:13].isdigit() or not "01" <= month <= "12":
+        return iso_str[:16]
+    hour = int(iso_str[11:13])
+    clock = f"{hour % 12 or 12}:{iso_str[14:16]} {'PM' if hour >= 12 else 'AM'}"
+    if iso_str[:10] == today_iso:
+        return clock
+    return f"{_MONTH_ABBR[int(month) - 1]} {iso_str[8:10]}, {clock}"
+
+
+@lru_cache(maxsize=1)
+def _updater_version():
+    """Return the app version from the updater, or None if it isn't available."""
+    try:
+        from updater import get_version
+    except ImportError:
+        return None
+    return get_version()
+
 
 class ModernRelicApp(ctk.CTk):
     """Modern GUI Application for The Relic Vault."""
     
-    COLORS = {
-        'bg_primary': '#0a0a0a',
-        'bg_secondary': '#141414',
-        'bg_card': '#1e1e1e',
-        'bg_hover': '#2a2a2a',
-        'accent': '#8b5cf6',
-        'accent_hover': '#a78bfa',
-        'accent_dim': '#7c3aed',
-        'success': '#22c55e',
-        'warning': '#f59e0b',
-        'error': '#ef4444',
-        'text': '#ffffff',
-        'text_secondary': '#a1a1aa',
-        'text_muted': '#71717a',
-        'gold': '#fbbf24',
-        'platinum': '#60a5fa',
-        'border': '#2a2a2a',
-    }
-    
-    # Fun custom titles for specific users (case-insensitive)
-    CUSTOM_TITLES = {
-        'itsveilor': ('twitch.tv/ItsVeilor', "#9146FF"),
-        'weeyins': ('The Creator', "#bda000"),
-        'barohunter': ('🪙 Ducat Daddy', '#fbbf24'),
-        'formafarm': ('⚡ Forma Fiend', '#60a5fa'),
-        'primepapi': ('💎 Prime Papi', '#22c55e'),
-        # Add more custom titles here!
-    }
+    COLORS = COLORS  # Shared with tabs and dialogs via app.COLORS
     
     def __init__(self):
         super().__init__()
@@ -79,20 +193,39 @@ class ModernRelicApp(ctk.CTk):
         self.relics = self.db.get_all_relics()
         if not self.relics:
             # First run - load sample data
-            self.relics = get_sample_relics()
+            self.relics = list(get_sample_relics())
             self.db.save_relics_batch(self.relics)
+        self._relic_index = None
+        self._names_by_era = None
         
         # Load inventory from database
         self.inventory: list[InventoryItem] = self.db.get_all_inventory()
-        print(f"DEBUG: Loaded {len(self.inventory)} inventory items from database")
+        self._rebuild_inventory_index()
+        self._inventory_dirty = False
+        self._inv_flush_job = None
+        logger.info("Loaded %d inventory items from database", len(self.inventory))
         
-        # Load settings
+        # Load settings (kept in memory; writes are coalesced by save_settings)
         self.settings = self.load_settings()
+        self._settings_dirty = False
+        self._settings_flush_job = None
+        self._refresh_setting_cache()
         
         # Initialize API clients
         self.market_api = WarframeMarketAPI()
-        self.alecaframe_api = AlecaFrameAPI(self.settings.get('alecaframe_token'))
+        self.alecaframe_api = AlecaFrameAPI(self._alecaframe_token)
         self.price_cache: dict[str, PriceData] = {}
+        self._last_sync_cache_key = None
+        self._last_sync_cache = None
+        self._last_sync_dirty = True
+        self._update_cache = None
+        self._update_cache_ts = 0.0
+        
+        # Single long-lived worker for AlecaFrame syncs
+        self._sync_executor = _DaemonWorker("sync")
+        self._sync_in_flight = threading.Event()
+        # Read-only queries for tab views, kept off the Tk thread
+        self.db_executor = _DaemonWorker("db")
         
         # Initialize tab handlers
 
@@ -109,9 +242,12 @@ class ModernRelicApp(ctk.CTk):
         self.load_saved_profile()
         
         # Start auto-sync timer if enabled
-        self.auto_sync_job = None
+        self._auto_sync_timer = None
         self.start_auto_sync_timer()
         
+        # Flush pending writes before the window goes away
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        
     def load_saved_profile(self):
         """Load profile from database if available."""
         try:
@@ -132,56 +268,157 @@ class ModernRelicApp(ctk.CTk):
                 )
                 self.update_profile_display(profile)
         except Exception as e:
-            print(f"Error loading saved profile: {e}")
+            logger.warning("Error loading saved profile: %s", e)
     
     def start_auto_sync_timer(self):
         """Start or restart the auto-sync timer based on settings."""
         # Cancel existing timer if any
-        if self.auto_sync_job:
-            self.after_cancel(self.auto_sync_job)
-            self.auto_sync_job = None
+        if self._auto_sync_timer:
+            self._auto_sync_timer.cancel()
+            self._auto_sync_timer = None
         
         # Check if auto-sync is enabled
-        if self.settings.get('auto_sync', False) and self.settings.get('alecaframe_token'):
-            # Schedule sync every 2 minutes (120000 ms)
-            self.auto_sync_job = self.after(120000, self.auto_sync_tick)
-            print("Auto-sync enabled: will sync every 2 minutes")
+        if self._auto_sync_enabled and self._alecaframe_token:
+            self._arm_auto_sync_timer()
+            logger.debug("Auto-sync enabled: will sync every 2 minutes")
+    
+    def _arm_auto_sync_timer(self):
+        """Schedule the next auto-sync on a daemon timer (every 2 minutes).
+        
+        The timer lives outside Tk, so the event loop only gets woken when a
+        sync is actually due.
+        """
+        self._auto_sync_timer = threading.Timer(120.0, self._fire_auto_sync)
+        self._auto_sync_timer.daemon = True
+        self._auto_sync_timer.start()
+    
+    def _fire_auto_sync(self):
+        """Timer thread callback: hand the tick over to the Tk thread."""
+        self.after(0, self.auto_sync_tick)
     
     def auto_sync_tick(self):
         """Perform auto-sync and reschedule."""
-        if self.settings.get('auto_sync', False):
-            print("Auto-sync: syncing AlecaFrame...")
+        if self._auto_sync_enabled:
+            logger.debug("Auto-sync: syncing AlecaFrame...")
             self.sync_alecaframe()
             # Reschedule
-            self.auto_sync_job = self.after(120000, self.auto_sync_tick)
+            self._arm_auto_sync_timer()
         
+    def _refresh_setting_cache(self):
+        """Snapshot settings read on the sync path (they only change via open_settings)."""
+        self._auto_sync_enabled = bool(self.settings.get('auto_sync', False))
+        self._alecaframe_token = self.settings.get('alecaframe_token')
+    
     def load_settings(self):
         """Load application settings."""
         try:
-            if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r') as f:
-                    return json.load(f)
+            with open(self.settings_file, 'r') as f:
+                return json.load(f)
         except:
             pass
         return {}
     
     def save_settings(self):
-        """Save application settings."""
+        """Mark settings as changed and schedule a write (rapid changes collapse into one)."""
+        self._settings_dirty = True
+        if self._settings_flush_job:
+            self.after_cancel(self._settings_flush_job)
+        self._settings_flush_job = self.after(500, self._flush_settings)
+    
+    def _flush_settings(self):
+        """Write application settings to disk if they changed."""
+        if self._settings_flush_job:
+            self.after_cancel(self._settings_flush_job)
+            self._settings_flush_job = None
+        if not self._settings_dirty:
+            return
         try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            # Encode up front so the file gets a single write() call
+            data = json.dumps(self.settings, separators=(',', ':')).encode('utf-8')
+            with open(self.settings_file, 'wb', buffering=8192) as f:
+                f.write(data)
+            self._settings_dirty = False
         except Exception as e:
-            print(f"Failed to save settings: {e}")
+            logger.error("Failed to save settings: %s", e)
+    
+    def on_close(self):
+        """Flush pending writes and close the app."""
+        if self._auto_sync_timer:
+            self._auto_sync_timer.cancel()
+        self._sync_executor.shutdown()
+        self.db_executor.shutdown()
+        self._flush_inventory()
+        self._flush_settings()
+        self.destroy()
+    
+    def get_relic_index(self) -> dict:
+        """Return the (era, name) -> Relic index, building it on first use."""
+        if self._relic_index is None:
+            index = {}
+            for r in self.relics:
+                index.setdefault((r.era.value, r.name), r)
+            self._relic_index = index
+        return self._relic_index
+    
+    def get_relic_names_by_era(self) -> dict:
+        """Return era value -> relic names (in relic list order), building it on first use."""
+        if self._names_by_era is None:
+            names = defaultdict(list)
+            for r in self.relics:
+                names[r.era.value].append(r.name)
+            self._names_by_era = dict(names)
+        return self._names_by_era
+    
+    def invalidate_relic_cache(self):
+        """Drop cached relic lookups; call after the relic list changes."""
+        self._relic_index = None
+        self._names_by_era = None
+    
+    @staticmethod
+    def _inventory_key(relic: Relic, refinement: RelicRefinement) -> tuple:
+        """Key identifying an inventory row: (era, name, refinement) values."""
+        return (relic.era.value, relic.name, refinement.value)
+    
+    def _rebuild_inventory_index(self):
+        """Rebuild the (era, name, refinement) -> InventoryItem lookup."""
+        self._inventory_index = {
+            self._inventory_key(item.relic, item.refinement): item
+            for item in self.inventory if item.relic
+        }
+    
+    def get_inventory_item(self, key: tuple) -> InventoryItem | None:
+        """Return the inventory item for an (era, name, refinement) key, if owned."""
+        return self._inventory_index.get(key)
+    
+    def remove_inventory_item(self, item: InventoryItem):
+        """Remove an item from the inventory and its lookup index."""
+        self.inventory.remove(item)
+        if item.relic:
+            self._inventory_index.pop(self._inventory_key(item.relic, item.refinement), None)
     
     def save_inventory(self):
-        """Save inventory to database."""
+        """Mark inventory as changed and schedule a write (rapid edits collapse into one)."""
+        self._inventory_dirty = True
+        if self._inv_flush_job:
+            self.after_cancel(self._inv_flush_job)
+        self._inv_flush_job = self.after(300, self._flush_inventory)
+    
+    def _flush_inventory(self):
+        """Save inventory to database if it changed."""
+        if self._inv_flush_job:
+            self.after_cancel(self._inv_flush_job)
+            self._inv_flush_job = None
+        if not self._inventory_dirty:
+            return
         try:
             self.db.save_inventory_batch(self.inventory)
+            self._inventory_dirty = False
         except Exception as e:
-            print(f"Error saving inventory: {e}")
+            logger.error("Error saving inventory: %s", e)
     
     def create_layout(self):
         """Create the main application layout."""
+        C = COLORS
         # Configure grid
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(0, weight=1)
@@ -190,13 +427,14 @@ class ModernRelicApp(ctk.CTk):
         self.create_sidebar()
         
         # Main content area
-        self.main_frame = ctk.CTkFrame(self, fg_color=self.COLORS['bg_primary'], corner_radius=0)
+        self.main_frame = ctk.CTkFrame(self, fg_color=C['bg_primary'], corner_radius=0)
         self.main_frame.grid(row=0, column=1, sticky="nsew")
         self.main_frame.grid_columnconfigure(0, weight=1)
         self.main_frame.grid_rowconfigure(1, weight=1)
         
         # Content frames for each section
         self.frames = {}
+        self._active_nav = None
         self.create_content_frames()
         
         # Show inventory by default
@@ -204,8 +442,9 @@ class ModernRelicApp(ctk.CTk):
     
     def create_sidebar(self):
         """Create the modern sidebar navigation."""
+        C = COLORS
         sidebar = ctk.CTkFrame(self, width=220, corner_radius=0, 
-                              fg_color=self.COLORS['bg_secondary'])
+                              fg_color=C['bg_secondary'])
         sidebar.grid(row=0, column=0, sticky="nsew")
         sidebar.grid_rowconfigure(10, weight=1)  # Push bottom items down
         
@@ -250,7 +489,7 @@ class ModernRelicApp(ctk.CTk):
         right_ornament.pack(side="left", padx=(4, 0))
         
         # Profile section at top (row 1) - shows after sync
-        self.profile_frame = ctk.CTkFrame(sidebar, fg_color=self.COLORS['bg_card'], corner_radius=10)
+        self.profile_frame = ctk.CTkFrame(sidebar, fg_color=C['bg_card'], corner_radius=10)
         self.profile_frame.grid(row=1, column=0, padx=12, pady=(5, 15), sticky="ew")
         
         # Profile header with MR icon
@@ -272,13 +511,13 @@ class ModernRelicApp(ctk.CTk):
         
         self.username_label = ctk.CTkLabel(username_row, text="Not synced",
                                            font=ctk.CTkFont(size=12, weight="bold"),
-                                           text_color=self.COLORS['text'])
+                                           text_color=C['text'])
         self.username_label.pack(side="left")
         
         # Custom title label (hidden by default)
         self.title_label = ctk.CTkLabel(username_row, text="",
                                         font=ctk.CTkFont(size=10),
-                                        text_color=self.COLORS['gold'])
+                                        text_color=C['gold'])
         self.title_label.pack(side="left", padx=(6, 0))
         self.title_label.pack_forget()  # Hide until we have a title
         
@@ -286,74 +525,27 @@ class ModernRelicApp(ctk.CTk):
         stats_frame = ctk.CTkFrame(self.profile_frame, fg_color="transparent")
         stats_frame.pack(fill="x", padx=8, pady=(0, 12))
         
-        # Platinum, Credits, Ducats mini-stats
+        # Platinum, Credits, Ducats mini-stats: (stat key, icon path getter, image attribute)
+        stat_specs = [
+            ('plat', get_platinum_icon_path, 'plat_icon_image'),
+            ('credits', get_credits_icon_path, 'credits_icon_image'),
+            ('ducats', get_ducats_icon_path, 'ducats_icon_image'),
+        ]
         self.stat_labels = {}
-        self.plat_icon_image = None  # Store reference
-        self.credits_icon_image = None
-        self.ducats_icon_image = None
-        
-        # Platinum stat (with icon)
-        plat_mini = ctk.CTkFrame(stats_frame, fg_color="transparent")
-        plat_mini.pack(side="left", expand=True)
-        
-        # Try to load platinum icon
-        plat_icon_path = get_platinum_icon_path(16)
-        if plat_icon_path and os.path.exists(plat_icon_path):
+        for key, path_fn, attr in stat_specs:
+            # Try to load the stat icon
             try:
-                plat_pil = Image.open(plat_icon_path)
-                self.plat_icon_image = ctk.CTkImage(light_image=plat_pil, dark_image=plat_pil, size=(16, 16))
-                plat_icon_lbl = ctk.CTkLabel(plat_mini, text="", image=self.plat_icon_image, width=16)
-                plat_icon_lbl.pack(side="left")
-            except:
-                pass
-        
-        plat_lbl = ctk.CTkLabel(plat_mini, text="0",
+                img = _load_ctk_image(path_fn(16), 16)
+            except (OSError, TypeError):
+                img = None
+            setattr(self, attr, img)  # Store reference
+            
+            # One label per stat: icon and value side by side
+            lbl = ctk.CTkLabel(stats_frame, text="0", image=img, compound="left",
                                font=ctk.CTkFont(size=10),
-                               text_color=self.COLORS['text_secondary'])
-        plat_lbl.pack(side="left", padx=(2, 0))
-        self.stat_labels['plat'] = plat_lbl
-        
-        # Credits stat (with icon)
-        credits_mini = ctk.CTkFrame(stats_frame, fg_color="transparent")
-        credits_mini.pack(side="left", expand=True)
-        
-        # Try to load credits icon
-        credits_icon_path = get_credits_icon_path(16)
-        if credits_icon_path and os.path.exists(credits_icon_path):
-            try:
-                credits_pil = Image.open(credits_icon_path)
-                self.credits_icon_image = ctk.CTkImage(light_image=credits_pil, dark_image=credits_pil, size=(16, 16))
-                credits_icon_lbl = ctk.CTkLabel(credits_mini, text="", image=self.credits_icon_image, width=16)
-                credits_icon_lbl.pack(side="left")
-            except:
-                pass
-        
-        credits_lbl = ctk.CTkLabel(credits_mini, text="0",
-                                   font=ctk.CTkFont(size=10),
-                                   text_color=self.COLORS['text_secondary'])
-        credits_lbl.pack(side="left", padx=(2, 0))
-        self.stat_labels['credits'] = credits_lbl
-        
-        # Ducats stat (with icon)
-        ducats_mini = ctk.CTkFrame(stats_frame, fg_color="transparent")
-        ducats_mini.pack(side="left", expand=True)
-        
-        # Try to load ducats icon
-        ducats_icon_path = get_ducats_icon_path(16)
-        if ducats_icon_path and os.path.exists(ducats_icon_path):
-            try:
-                ducats_pil = Image.open(ducats_icon_path)
-                self.ducats_icon_image = ctk.CTkImage(light_image=ducats_pil, dark_image=ducats_pil, size=(16, 16))
-                ducats_icon_lbl = ctk.CTkLabel(ducats_mini, text="", image=self.ducats_icon_image, width=16)
-                ducats_icon_lbl.pack(side="left")
-            except:
-                pass
-        
-        ducats_lbl = ctk.CTkLabel(ducats_mini, text="0",
-                                  font=ctk.CTkFont(size=10),
-                                  text_color=self.COLORS['text_secondary'])
-        ducats_lbl.pack(side="left", padx=(2, 0))
-        self.stat_labels['ducats'] = ducats_lbl
+                               text_color=C['text_secondary'])
+            lbl.pack(side="left", expand=True)
+            self.stat_labels[key] = lbl
         
         # Hide profile section initially if not synced
         self.profile_frame.grid_remove()
@@ -374,12 +566,12 @@ class ModernRelicApp(ctk.CTk):
                 text=f"  {icon}   {text}",
                 font=ctk.CTkFont(family="Segoe UI", size=13),
                 fg_color="transparent",
-                text_color=self.COLORS['text_secondary'],
-                hover_color=self.COLORS['bg_hover'],
+                text_color=C['text_secondary'],
+                hover_color=C['bg_hover'],
                 anchor="w",
                 height=42,
                 corner_radius=8,
-                command=lambda f=frame_name: self.show_frame(f)
+                command=partial(self.show_frame, frame_name)
             )
             btn.grid(row=i+2, column=0, padx=12, pady=2, sticky="ew")
             self.nav_buttons[frame_name] = btn
@@ -393,9 +585,9 @@ class ModernRelicApp(ctk.CTk):
             bottom_frame,
             text="⟳  Sync AlecaFrame",
             font=ctk.CTkFont(family="Segoe UI", size=12),
-            fg_color=self.COLORS['bg_card'],
-            hover_color=self.COLORS['bg_hover'],
-            text_color=self.COLORS['text_secondary'],
+            fg_color=C['bg_card'],
+            hover_color=C['bg_hover'],
+            text_color=C['text_secondary'],
             height=38,
             corner_radius=8,
             command=self.sync_alecaframe
@@ -408,8 +600,8 @@ class ModernRelicApp(ctk.CTk):
             text="⚙  Settings",
             font=ctk.CTkFont(family="Segoe UI", size=12),
             fg_color="transparent",
-            hover_color=self.COLORS['bg_hover'],
-            text_color=self.COLORS['text_muted'],
+            hover_color=C['bg_hover'],
+            text_color=C['text_muted'],
             height=38,
             corner_radius=8,
             command=self.open_settings
@@ -421,7 +613,7 @@ class ModernRelicApp(ctk.CTk):
             bottom_frame,
             text="● Online",
             font=ctk.CTkFont(family="Segoe UI", size=11),
-            text_color=self.COLORS['success']
+            text_color=C['success']
         )
         self.status_label.pack(pady=(15, 0))
         
@@ -430,7 +622,7 @@ class ModernRelicApp(ctk.CTk):
             bottom_frame,
             text="",
             font=ctk.CTkFont(family="Segoe UI", size=10),
-            text_color=self.COLORS['text_muted']
+            text_color=C['text_muted']
         )
         self.last_sync_label.pack(pady=(2, 0))
         
@@ -439,29 +631,51 @@ class ModernRelicApp(ctk.CTk):
     
     def show_frame(self, frame_name):
         """Switch to a different content frame."""
-        # Update nav button states
-        for name, btn in self.nav_buttons.items():
-            if name == frame_name:
-                btn.configure(fg_color=self.COLORS['accent'], 
-                            text_color=self.COLORS['text'])
-            else:
-                btn.configure(fg_color="transparent", 
-                            text_color=self.COLORS['text_secondary'])
+        C = COLORS
+        prev = self._active_nav
+        if prev == frame_name:
+            return
+        
+        # Update nav button states (only the two that change)
+        if prev:
+            self.nav_buttons[prev].configure(fg_color="transparent", 
+                                             text_color=C['text_secondary'])
+        self.nav_buttons[frame_name].configure(fg_color=C['accent'], 
+                                               text_color=C['text'])
+        self._active_nav = frame_name
+        
+        # Build the frame on first visit
+        if frame_name not in self.frames:
+            self.frames[frame_name] = self._frame_factories[frame_name]()
         
         # Show the selected frame
-        for name, frame in self.frames.items():
-            if name == frame_name:
-                frame.grid(row=0, column=0, sticky="nsew", padx=30, pady=30)
-            else:
-                frame.grid_forget()
+        if prev:
+            self.frames[prev].grid_forget()
+            on_hidden = self._frame_hidden_hooks.get(prev)
+            if on_hidden:
+                on_hidden()
+        self.frames[frame_name].grid(row=0, column=0, sticky="nsew", padx=30, pady=30)
+        
+        on_shown = self._frame_shown_hooks.get(frame_name)
+        if on_shown:
+            on_shown()
     
     def create_content_frames(self):
-        """Create all content frames."""
-        self.frames["prices"] = self.prices_tab.create_frame(self.main_frame)
-        self.frames["inventory"] = self.inventory_tab.create_frame(self.main_frame)
-        self.frames["relics"] = self.relics_tab.create_frame(self.main_frame)
-        self.frames["cascade"] = self.cascade_tab.create_frame(self.main_frame)
-        self.frames["history"] = self.history_tab.create_frame(self.main_frame)
+        """Register content frame factories; each frame is built when first shown."""
+        self._frame_factories = {
+            "prices": partial(self.prices_tab.create_frame, self.main_frame),
+            "inventory": partial(self.inventory_tab.create_frame, self.main_frame),
+            "relics": partial(self.relics_tab.create_frame, self.main_frame),
+            "cascade": partial(self.cascade_tab.create_frame, self.main_frame),
+            "history": partial(self.history_tab.create_frame, self.main_frame),
+        }
+        # Tabs that load their data only once they're actually shown
+        self._frame_shown_hooks = {
+            "history": self.history_tab.on_tab_shown,
+        }
+        self._frame_hidden_hooks = {
+            "history": self.history_tab.on_tab_hidden,
+        }
     
     def refresh_inventory(self):
         """Refresh the inventory display (delegate to tab)."""
@@ -475,12 +689,14 @@ class ModernRelicApp(ctk.CTk):
         if dialog.result:
             relic, refinement, quantity = dialog.result
             # Check if already exists
-            for item in self.inventory:
-                if item.relic == relic and item.refinement == refinement:
-                    item.quantity += quantity
-                    break
+            key = self._inventory_key(relic, refinement)
+            item = self._inventory_index.get(key)
+            if item:
+                item.quantity += quantity
             else:
-                self.inventory.append(InventoryItem(relic, refinement, quantity))
+                item = InventoryItem(relic, refinement, quantity)
+                self.inventory.append(item)
+                self._inventory_index[key] = item
             
             self.save_inventory()
             self.refresh_inventory()
@@ -494,14 +710,13 @@ class ModernRelicApp(ctk.CTk):
             # Update MR badge with hexagon icon
             try:
                 mr_icon_path = get_mastery_icon_path(profile.mastery_rank, 44)
-                if mr_icon_path and os.path.exists(mr_icon_path):
-                    mr_pil = Image.open(mr_icon_path)
-                    self.mr_image = ctk.CTkImage(light_image=mr_pil, dark_image=mr_pil, size=(44, 44))
-                    self.mr_image_label.configure(image=self.mr_image, text="")
-                else:
-                    self.mr_image_label.configure(text=str(profile.mastery_rank))
+                self.mr_image = _load_ctk_image(mr_icon_path, 44)
+                self.mr_image_label.configure(image=self.mr_image, text="")
+            except (OSError, TypeError):
+                # No badge on disk, fall back to the plain number
+                self.mr_image_label.configure(text=str(profile.mastery_rank))
             except Exception as e:
-                print(f"Error loading MR icon: {e}")
+                logger.warning("Error loading MR icon: %s", e)
                 self.mr_image_label.configure(text=str(profile.mastery_rank))
             
             # Update username and custom title
@@ -509,9 +724,11 @@ class ModernRelicApp(ctk.CTk):
                 self.username_label.configure(text=profile.username)
                 
                 # Check for custom title
-                username_lower = profile.username.lower()
-                if username_lower in self.CUSTOM_TITLES:
-                    title_text, title_color = self.CUSTOM_TITLES[username_lower]
+                entry = None
+                if _CUSTOM_TITLE_MIN_LEN <= len(profile.username) <= _CUSTOM_TITLE_MAX_LEN:
+                    entry = _CUSTOM_TITLES_CF.get(profile.username.casefold())
+                if entry:
+                    title_text, title_color = entry
                     self.title_label.configure(text=title_text, text_color=title_color)
                     self.title_label.pack(side="left", padx=(6, 0))
                 else:
@@ -523,20 +740,29 @@ class ModernRelicApp(ctk.CTk):
             self.stat_labels['ducats'].configure(text=f"{profile.ducats:,}")
             
         except Exception as e:
-            print(f"Error updating profile display: {e}")
+            logger.warning("Error updating profile display: %s", e)
     
     def sync_alecaframe(self):
         """Sync inventory with AlecaFrame."""
-        token = self.settings.get('alecaframe_token')
+        token = self._alecaframe_token
         if not token:
             self.open_settings()
             return
         
+        # Drop overlapping requests (manual click during an auto-sync, etc.)
+        if self._sync_in_flight.is_set():
+            return
+        self._sync_in_flight.set()
+        
+        # Write out pending local edits before the merge replaces the inventory
+        self._flush_inventory()
+        
         # Show loading
         self.status_label.configure(text="⟳ Syncing...", text_color=self.COLORS['warning'])
-        self.update()
+        self.status_label.update_idletasks()
         
         def do_sync():
+            result = {'profile': None, 'status_text': None, 'status_color': None, 'refresh': False}
             try:
                 self.alecaframe_api.set_token(token)
                 
@@ -556,102 +782,106 @@ class ModernRelicApp(ctk.CTk):
                         'relics_opened': profile.relics_opened,
                         'trades': profile.trades
                     })
-                    self.after(0, lambda p=profile: self.update_profile_display(p))
+                    result['profile'] = profile
                 
                 # Fetch inventory
                 inventory = self.alecaframe_api.get_inventory()
                 
                 if inventory.error:
-                    self.after(0, lambda: self.status_label.configure(
-                        text="✗ " + inventory.error[:20],
-                        text_color=self.COLORS['error']
-                    ))
-                    print(f"Sync error: {inventory.error}")
-                    return
-                
-                if inventory.relics:
+                    result['status_text'] = "✗ " + inventory.error[:20]
+                    result['status_color'] = self.COLORS['error']
+                    logger.warning("Sync error: %s", inventory.error)
+                elif inventory.relics:
                     # Merge inventory
                     self.inventory.clear()
                     new_relics = []
+                    relic_lookup = self.get_relic_index()
                     
                     for relic_item in inventory.relics:
                         # Find matching relic
-                        matching_relic = None
-                        for relic in self.relics:
-                            if relic.era.value == relic_item.era and relic.name == relic_item.identifier:
-                                matching_relic = relic
-                                break
+                        matching_relic = relic_lookup.get((relic_item.era, relic_item.identifier))
                         
                         if not matching_relic:
                             # Create new relic entry
-                            era_map = {'Lith': RelicEra.LITH, 'Meso': RelicEra.MESO,
-                                       'Neo': RelicEra.NEO, 'Axi': RelicEra.AXI}
-                            era = era_map.get(relic_item.era, RelicEra.LITH)
-                            matching_relic = Relic(era, relic_item.identifier, [], False)
-                            self.relics.append(matching_relic)
+                            era = _ERA_MAP.get(relic_item.era, RelicEra.LITH)
+                            matching_relic = Relic(era, relic_item.identifier, (), False)
                             new_relics.append(matching_relic)
+                            relic_lookup[(relic_item.era, relic_item.identifier)] = matching_relic
                         
-                        ref_map = {'Intact': RelicRefinement.INTACT,
-                                   'Exceptional': RelicRefinement.EXCEPTIONAL,
-                                   'Flawless': RelicRefinement.FLAWLESS,
-                                   'Radiant': RelicRefinement.RADIANT}
-                        refinement = ref_map.get(relic_item.refinement, RelicRefinement.INTACT)
+                        refinement = _REF_MAP.get(relic_item.refinement, RelicRefinement.INTACT)
                         
                         self.inventory.append(InventoryItem(matching_relic, refinement, relic_item.quantity))
                     
-                    # Save new relics to database
+                    self._rebuild_inventory_index()
+                    
+                    # Register and save new relics in one go
                     if new_relics:
+                        self.relics.extend(new_relics)
+                        self.invalidate_relic_cache()
                         self.db.save_relics_batch(new_relics)
                     
-                    # Save inventory to database
-                    self.save_inventory()
+                    # Save inventory to database (already on a worker thread, so write now)
+                    self._inventory_dirty = True
+                    self._flush_inventory()
                     
                     # Update sync metadata
                     self.db.update_sync_metadata("AlecaFrame")
+                    self._last_sync_dirty = True
                     
-                    self.after(0, self.refresh_inventory)
-                    self.after(0, lambda: self.status_label.configure(
-                        text=f"✓ Synced {len(self.inventory)} relics",
-                        text_color=self.COLORS['success']
-                    ))
-                    self.after(0, self._update_last_sync_display)
+                    result['status_text'] = f"✓ Synced {len(self.inventory)} relics"
+                    result['status_color'] = self.COLORS['success']
+                    result['refresh'] = True
                 else:
-                    self.after(0, lambda: self.status_label.configure(
-                        text="✗ No relics found",
-                        text_color=self.COLORS['error']
-                    ))
+                    result['status_text'] = "✗ No relics found"
+                    result['status_color'] = self.COLORS['error']
             except Exception as e:
-                self.after(0, lambda: self.status_label.configure(
-                    text=f"✗ Error",
-                    text_color=self.COLORS['error']
-                ))
-                print(f"Sync error: {e}")
+                result['status_text'] = "✗ Error"
+                result['status_color'] = self.COLORS['error']
+                logger.warning("Sync error: %s", e)
+            finally:
+                self._sync_in_flight.clear()
+            
+            # Hand everything back to the UI thread in a single callback
+            self.after(0, self._apply_sync_result, result)
         
-        threading.Thread(target=do_sync, daemon=True).start()
+        self._sync_executor.submit(do_sync)
+    
+    def _apply_sync_result(self, result):
+        """Apply the outcome of a background sync to the UI in one pass."""
+        if result['profile'] is not None:
+            self.update_profile_display(result['profile'])
+        if result['refresh']:
+            self.refresh_inventory()
+        if result['status_text']:
+            self.status_label.configure(text=result['status_text'], text_color=result['status_color'])
+        if result['refresh']:
+            self._update_last_sync_display()
+    
+    def get_last_sync(self):
+        """Return sync metadata, only querying the database after a sync changed it."""
+        if self._last_sync_dirty:
+            self._last_sync_cache = self.db.get_last_sync()
+            self._last_sync_dirty = False
+        return self._last_sync_cache
     
     def _update_last_sync_display(self):
         """Update the last sync timestamp display."""
         try:
-            sync_info = self.db.get_last_sync()
+            sync_info = self.get_last_sync()
             if sync_info and sync_info.get('last_sync'):
-                from datetime import datetime
                 last_sync_str = sync_info['last_sync']
-                # Parse the datetime string
-                try:
-                    last_sync = datetime.fromisoformat(last_sync_str)
-                    # Format as "Last sync: 2:30 PM" or "Last sync: Jan 31, 2:30 PM"
-                    now = datetime.now()
-                    if last_sync.date() == now.date():
-                        time_str = last_sync.strftime("%I:%M %p").lstrip("0")
-                    else:
-                        time_str = last_sync.strftime("%b %d, %I:%M %p").lstrip("0")
-                    self.last_sync_label.configure(text=f"Last sync: {time_str}")
-                except:
-                    self.last_sync_label.configure(text=f"Last sync: {last_sync_str[:16]}")
+                today_iso = date.today().isoformat()
+                # Same timestamp on the same day renders identically; skip the re-format
+                cache_key = (last_sync_str, today_iso)
+                if cache_key == self._last_sync_cache_key:
+                    return
+                self.last_sync_label.configure(text=f"Last sync: {_format_sync_time(last_sync_str, today_iso)}")
+                self._last_sync_cache_key = cache_key
             else:
+                self._last_sync_cache_key = None
                 self.last_sync_label.configure(text="")
         except Exception as e:
-            print(f"Error updating last sync display: {e}")
+            logger.warning("Error updating last sync display: %s", e)
     
     def open_settings(self):
         """Open settings dialog."""
@@ -661,7 +891,8 @@ class ModernRelicApp(ctk.CTk):
         if dialog.result:
             self.settings = dialog.result
             self.save_settings()
-            self.alecaframe_api = AlecaFrameAPI(self.settings.get('alecaframe_token'))
+            self._refresh_setting_cache()
+            self.alecaframe_api = AlecaFrameAPI(self._alecaframe_token)
             # Restart auto-sync timer with new settings
             self.start_auto_sync_timer()
 
@@ -676,26 +907,29 @@ class AddRelicDialog(ctk.CTkToplevel):
         self.geometry("400x350")
         self.configure(fg_color=colors['bg_primary'])
         
-        self.transient(parent)
-        self.grab_set()
-        
         self.relics = relics
         self.colors = colors
         self.result = None
         
+        # Relic lookups come from the app's cached indexes
+        self._by_era = parent.get_relic_names_by_era()
+        self._by_key = parent.get_relic_index()
+        self._last_era = None
+        self._era_after_id = None
+        
         # Era
         era_frame = ctk.CTkFrame(self, fg_color="transparent")
         era_frame.pack(fill="x", padx=30, pady=(30, 15))
         
         ctk.CTkLabel(era_frame, text="Era", 
-                    font=ctk.CTkFont(size=13),
+                    font=_font(13),
                     text_color=colors['text_muted']).pack(anchor="w")
         
         self.era_combo = ctk.CTkComboBox(
             era_frame,
             values=["Lith", "Meso", "Neo", "Axi"],
             fg_color=colors['bg_card'],
-            command=self.update_relics
+            command=self._schedule_update_relics
         )
         self.era_combo.set("Lith")
         self.era_combo.pack(fill="x", pady=(5, 0))
@@ -705,7 +939,7 @@ class AddRelicDialog(ctk.CTkToplevel):
         relic_frame.pack(fill="x", padx=30, pady=15)
         
         ctk.CTkLabel(relic_frame, text="Relic",
-                    font=ctk.CTkFont(size=13),
+                    font=_font(13),
                     text_color=colors['text_muted']).pack(anchor="w")
         
         self.relic_combo = ctk.CTkComboBox(
@@ -720,7 +954,7 @@ class AddRelicDialog(ctk.CTkToplevel):
         ref_frame.pack(fill="x", padx=30, pady=15)
         
         ctk.CTkLabel(ref_frame, text="Refinement",
-                    font=ctk.CTkFont(size=13),
+                    font=_font(13),
                     text_color=colors['text_muted']).pack(anchor="w")
         
         self.ref_combo = ctk.CTkComboBox(
@@ -736,7 +970,7 @@ class AddRelicDialog(ctk.CTkToplevel):
         qty_frame.pack(fill="x", padx=30, pady=15)
         
         ctk.CTkLabel(qty_frame, text="Quantity",
-                    font=ctk.CTkFont(size=13),
+                    font=_font(13),
                     text_color=colors['text_muted']).pack(anchor="w")
         
         self.qty_entry = ctk.CTkEntry(
@@ -768,41 +1002,60 @@ class AddRelicDialog(ctk.CTkToplevel):
         add_btn.pack(side="right", expand=True, padx=(10, 0))
         
         self.update_relics()
+        
+        # Attach to the parent and grab input once the widget tree is complete
+        self.transient(parent)
+        self.update_idletasks()
+        self.grab_set()
+    
+    def _schedule_update_relics(self, *args):
+        """Refill the relic dropdown once the era selection settles."""
+        if self._era_after_id:
+            self.after_cancel(self._era_after_id)
+        self._era_after_id = self.after(80, self.update_relics)
     
     def update_relics(self, *args):
         """Update relic dropdown."""
+        self._era_after_id = None
         era = self.era_combo.get()
-        relics = [r.name for r in self.relics if r.era.value == era]
+        if era == self._last_era:
+            return
+        self._last_era = era
+        relics = self._by_era.get(era, [])
         self.relic_combo.configure(values=relics if relics else ["No relics"])
         if relics:
             self.relic_combo.set(relics[0])
     
+    def _flush_update_relics(self):
+        """Apply a pending era change now so the relic dropdown matches the selected era."""
+        if self._era_after_id:
+            self.after_cancel(self._era_after_id)
+            self.update_relics()
+    
+    def destroy(self):
+        # Don't let a pending era refill fire against a destroyed dialog
+        if self._era_after_id:
+            self.after_cancel(self._era_after_id)
+            self._era_after_id = None
+        super().destroy()
+    
     def add_relic(self):
         """Add the relic."""
+        self._flush_update_relics()
         era = self.era_combo.get()
         relic_name = self.relic_combo.get()
         ref = self.ref_combo.get()
         
         try:
             qty = int(self.qty_entry.get())
-        except:
+        except ValueError:
             qty = 1
         
         # Find relic
-        relic = None
-        for r in self.relics:
-            if r.era.value == era and r.name == relic_name:
-                relic = r
-                break
+        relic = self._by_key.get((era, relic_name))
         
         if relic:
-            ref_map = {
-                "Intact": RelicRefinement.INTACT,
-                "Exceptional": RelicRefinement.EXCEPTIONAL,
-                "Flawless": RelicRefinement.FLAWLESS,
-                "Radiant": RelicRefinement.RADIANT
-            }
-            self.result = (relic, ref_map[ref], qty)
+            self.result = (relic, _REF_MAP[ref], qty)
         
         self.destroy()
 
@@ -817,38 +1070,26 @@ class SettingsDialog(ctk.CTkToplevel):
         self.geometry("500x580")
         self.configure(fg_color=colors['bg_primary'])
         
-        self.transient(parent)
-        self.grab_set()
+        # Keep the window hidden while it's built so Tk lays it out once
+        self.withdraw()
         
         self.settings = settings.copy()
         self.colors = colors
         self.result = None
         self.db = parent.db
         
-        # Import updater
-        try:
-            from updater import get_version, check_for_updates_async, UpdateInfo
-            self.has_updater = True
-            self.current_version = get_version()
-        except ImportError:
-            self.has_updater = False
-            self.current_version = "Unknown"
+        # Updater availability/version only needs resolving once per process
+        version = _updater_version()
+        self.has_updater = version is not None
+        self.current_version = version or "Unknown"
         
         # AlecaFrame section
-        section = ctk.CTkFrame(self, fg_color=colors['bg_card'], corner_radius=12)
-        section.pack(fill="x", padx=30, pady=(30, 15))
-        
-        title = ctk.CTkLabel(
-            section, text="AlecaFrame Integration",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=colors['text']
-        )
-        title.pack(anchor="w", padx=20, pady=(20, 5))
+        section = self._make_card("AlecaFrame Integration", pady=(30, 15), title_pady=(20, 5))
         
         desc = ctk.CTkLabel(
             section,
             text="Paste your AlecaFrame share URL or public token to sync your relic inventory",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             text_color=colors['text_muted'],
             wraplength=400
         )
@@ -874,7 +1115,7 @@ class SettingsDialog(ctk.CTkToplevel):
         self.autosync_toggle = ctk.CTkSwitch(
             autosync_frame,
             text="Auto-sync every 2 minutes",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             variable=self.autosync_var,
             onvalue=True,
             offvalue=False,
@@ -883,17 +1124,9 @@ class SettingsDialog(ctk.CTkToplevel):
         self.autosync_toggle.pack(side="left")
         
         # Last sync info
-        sync_info = self.db.get_last_sync()
+        sync_info = parent.get_last_sync()
         if sync_info:
-            sync_frame = ctk.CTkFrame(self, fg_color=colors['bg_card'], corner_radius=12)
-            sync_frame.pack(fill="x", padx=30, pady=(0, 15))
-            
-            sync_title = ctk.CTkLabel(
-                sync_frame, text="Database Status",
-                font=ctk.CTkFont(size=14, weight="bold"),
-                text_color=colors['text']
-            )
-            sync_title.pack(anchor="w", padx=20, pady=(15, 5))
+            sync_frame = self._make_card("Database Status", title_size=14)
             
             last_sync_text = f"Last synced: {sync_info['last_sync']}"
             if sync_info['total_relics']:
@@ -903,26 +1136,18 @@ class SettingsDialog(ctk.CTkToplevel):
             
             sync_label = ctk.CTkLabel(
                 sync_frame, text=last_sync_text,
-                font=ctk.CTkFont(size=12),
+                font=_font(12),
                 text_color=colors['text_muted']
             )
             sync_label.pack(anchor="w", padx=20, pady=(0, 15))
         
         # Updates section
-        update_section = ctk.CTkFrame(self, fg_color=colors['bg_card'], corner_radius=12)
-        update_section.pack(fill="x", padx=30, pady=(0, 15))
-        
-        update_title = ctk.CTkLabel(
-            update_section, text="Updates",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=colors['text']
-        )
-        update_title.pack(anchor="w", padx=20, pady=(15, 5))
+        update_section = self._make_card("Updates")
         
         version_label = ctk.CTkLabel(
             update_section,
             text=f"Current version: v{self.current_version}",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             text_color=colors['text_muted']
         )
         version_label.pack(anchor="w", padx=20, pady=(0, 10))
@@ -942,7 +1167,7 @@ class SettingsDialog(ctk.CTkToplevel):
         self.update_status_label = ctk.CTkLabel(
             update_btn_frame,
             text="",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             text_color=colors['text_muted']
         )
         self.update_status_label.pack(side="left", padx=(15, 0))
@@ -966,6 +1191,24 @@ class SettingsDialog(ctk.CTkToplevel):
             command=self.save
         )
         save_btn.pack(side="right", expand=True, padx=(10, 0))
+        
+        # Show the finished dialog in one pass (grab needs a viewable window)
+        self.transient(parent)
+        self.deiconify()
+        self.update_idletasks()
+        self.grab_set()
+    
+    def _make_card(self, title_text, title_size=16, pady=(0, 15), title_pady=(15, 5)):
+        """Create a titled card frame packed into the dialog."""
+        card = ctk.CTkFrame(self, fg_color=self.colors['bg_card'], corner_radius=12)
+        card.pack(fill="x", padx=30, pady=pady)
+        
+        ctk.CTkLabel(
+            card, text=title_text,
+            font=_font(title_size, "bold"),
+            text_color=self.colors['text']
+        ).pack(anchor="w", padx=20, pady=title_pady)
+        return card
     
     def check_for_updates(self):
         """Check GitHub for updates."""
@@ -973,6 +1216,12 @@ class SettingsDialog(ctk.CTkToplevel):
             self.update_status_label.configure(text="Updater not available")
             return
         
+        # Reuse a recent answer instead of asking GitHub again
+        app = self.master
+        if app._update_cache and time.monotonic() - app._update_cache_ts < UPDATE_CHECK_CACHE_SECONDS:
+            self._update_ui_after_check(app._update_cache)
+            return
+        
         self.check_update_btn.configure(state="disabled", text="Checking...")
         self.update_status_label.configure(text="")
         
@@ -981,8 +1230,11 @@ class SettingsDialog(ctk.CTkToplevel):
     
     def on_update_check_complete(self, update_info):
         """Handle update check result (called from background thread)."""
+        if not update_info.error:
+            self.master._update_cache = update_info
+            self.master._update_cache_ts = time.monotonic()
         # Schedule UI update on main thread
-        self.after(0, lambda: self._update_ui_after_check(update_info))
+        self.after(0, self._update_ui_after_check, update_info)
     
     def _update_ui_after_check(self, update_info):
         """Update UI after update check (on main thread)."""
@@ -1008,7 +1260,6 @@ class SettingsDialog(ctk.CTkToplevel):
     
     def show_update_dialog(self, update_info):
         """Show dialog with update details and auto-update option."""
-        import webbrowser
         from updater import is_frozen, download_and_apply_update
         
         dialog = ctk.CTkToplevel(self)
@@ -1021,7 +1272,7 @@ class SettingsDialog(ctk.CTkToplevel):
         title = ctk.CTkLabel(
             dialog,
             text=f"Version {update_info.latest_version} is available!",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=_font(18, "bold"),
             text_color=self.colors['text']
         )
         title.pack(pady=(30, 10))
@@ -1029,7 +1280,7 @@ class SettingsDialog(ctk.CTkToplevel):
         current = ctk.CTkLabel(
             dialog,
             text=f"Your version: v{update_info.current_version}",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             text_color=self.colors['text_muted']
         )
         current.pack()
@@ -1041,20 +1292,19 @@ class SettingsDialog(ctk.CTkToplevel):
             notes_title = ctk.CTkLabel(
                 notes_frame,
                 text="What's New:",
-                font=ctk.CTkFont(size=12, weight="bold"),
+                font=_font(12, "bold"),
                 text_color=self.colors['text']
             )
             notes_title.pack(anchor="w", padx=15, pady=(10, 5))
             
             # Show first 200 chars of release notes
-            notes_text = update_info.release_notes[:200]
-            if len(update_info.release_notes) > 200:
-                notes_text += "..."
+            rn = update_info.release_notes
+            notes_text = rn if len(rn) <= 200 else rn[:200] + "..."
             
             notes = ctk.CTkLabel(
                 notes_frame,
                 text=notes_text,
-                font=ctk.CTkFont(size=11),
+                font=_font(11),
                 text_color=self.colors['text_muted'],
                 wraplength=320,
                 justify="left"
@@ -1065,7 +1315,7 @@ class SettingsDialog(ctk.CTkToplevel):
         status_label = ctk.CTkLabel(
             dialog,
             text="",
-            font=ctk.CTkFont(size=11),
+            font=_font(11),
             text_color=self.colors['text_muted']
         )
         status_label.pack(pady=(0, 10))
@@ -1107,27 +1357,47 @@ class SettingsDialog(ctk.CTkToplevel):
             # Show progress bar
             progress_bar.pack(pady=(0, 10))
             
+            # The updater reports from its worker thread; events are queued and a
+            # single Tk-side pump applies them, keeping only the latest progress
+            events = queue.Queue()
+            
             def on_progress(status_text, downloaded, total):
-                def update():
+                events.put(('progress', status_text, downloaded, total))
+            
+            def on_complete(success, message):
+                events.put(('complete', success, message))
+            
+            def apply_complete(success, message):
+                status_label.configure(text=message)
+                if success:
+                    status_label.configure(text_color=self.colors['success'])
+                    # Close dialog and app after short delay
+                    dialog.after(1500, self._close_for_update, dialog)
+                else:
+                    status_label.configure(text_color=self.colors['warning'])
+                    update_btn.configure(state="normal", text="⬇ Install Update")
+                    close_btn.configure(state="normal")
+                    download_btn.configure(state="normal")
+            
+            def pump():
+                latest = None
+                while True:
+                    try:
+                        event = events.get_nowait()
+                    except queue.Empty:
+                        break
+                    if event[0] == 'complete':
+                        apply_complete(*event[1:])
+                        return
+                    latest = event
+                if latest:
+                    _, status_text, downloaded, total = latest
                     status_label.configure(text=status_text)
                     if total > 0:
                         progress_bar.set(downloaded / total)
-                dialog.after(0, update)
-            
-            def on_complete(success, message):
-                def update():
-                    status_label.configure(text=message)
-                    if success:
-                        status_label.configure(text_color=self.colors['success'])
-                        # Close dialog and app after short delay
-                        dialog.after(1500, lambda: self._close_for_update(dialog))
-                    else:
-                        status_label.configure(text_color=self.colors['warning'])
-                        update_btn.configure(state="normal", text="⬇ Install Update")
-                        close_btn.configure(state="normal")
-                        download_btn.configure(state="normal")
-                dialog.after(0, update)
+                dialog.after(33, pump)
             
+            dialog.after(33, pump)
             download_and_apply_update(update_info, on_progress, on_complete)
         
         download_btn = ctk.CTkButton(
@@ -1158,7 +1428,7 @@ class SettingsDialog(ctk.CTkToplevel):
         """Close dialog and app for update."""
         dialog.destroy()
         # Close the main app - the update script will restart it
-        self.master.destroy()
+        self.master.on_close()
     
     def save(self):
         """Save settings."""
@@ -1166,8 +1436,7 @@ class SettingsDialog(ctk.CTkToplevel):
         
         # Extract token from URL if needed
         if 'token=' in token:
-            import re
-            match = re.search(r'[?&]token=([^&]+)', token)
+            match = _ALECA_TOKEN_RE.search(token)
             if match:
                 token = match.group(1)
         
@@ -1179,6 +1448,8 @@ class SettingsDialog(ctk.CTkToplevel):
 
 def main():
     """Main entry point."""
+    # Quiet by default; set RELIC_DEBUG=1 for sync/debug chatter
+    logging.basicConfig(level=logging.DEBUG if os.environ.get('RELIC_DEBUG') else logging.WARNING)
     app = ModernRelicApp()
     app.mainloop()
 
@@ -4,22 +4,110 @@ Shows Void Cascade run history.
 """
 
 import customtkinter as ctk
-from tkinter import ttk
+from tkinter import ttk, messagebox
 import tkinter as tk
-from datetime import datetime
+from array import array
 from database import RelicDatabase
+from ui_fonts import get_font as _font
+
+# Sort order: Rare -> Uncommon -> Common -> Forma
+RARITY_ORDER = {'Rare': 0, 'Uncommon': 1, 'Common': 2, 'Forma Blueprint': 3}
+
+# Treeview tag per rarity; anything else is 'forma' by name or 'common'
+RARITY_TAG = {'Rare': 'rare', 'Uncommon': 'uncommon', 'Forma Blueprint': 'forma'}
+
+# Drops treeview tag -> foreground colour
+DROPS_TAG_COLORS = (
+    ('rare', '#ffd700'),
+    ('uncommon', '#c0c0c0'),
+    ('common', '#cd7f32'),
+    ('forma', '#60a5fa'),
+)
+
+# Prebuilt treeview tag tuples: ROW_TAGS[tag][i % 2] -> (tag, 'evenrow'|'oddrow')
+ROW_TAGS = {tag: ((tag, 'evenrow'), (tag, 'oddrow')) for tag, _ in DROPS_TAG_COLORS}
+
+
+class _RunRow(tk.Canvas):
+    """A run list row drawn on one canvas: rounded background plus title/stats text.
+    
+    Rows are pooled by the runs list and re-pointed at a different run with set_data().
+    """
+    
+    HEIGHT = 65
+    RADIUS = 8
+    PITCH = HEIGHT + 4  # row height plus 2px spacing above and below
+    
+    def __init__(self, parent, colors, command):
+        super().__init__(parent, height=self.HEIGHT, bg=colors['bg_secondary'],
+                         highlightthickness=0, bd=0, cursor="hand2")
+        self.colors = colors
+        self.selected = False
+        self.run = None
+        
+        self.create_polygon(0, 0, 0, 0, 0, 0, smooth=True, tags='bg')
+        self.create_text(0, 22, anchor="w", tags='title',
+                         font=('Segoe UI', 12, 'bold'), fill=colors['text'])
+        self.create_text(0, 44, anchor="w", tags='stats',
+                         font=('Segoe UI', 10), fill=colors['text_secondary'])
+        
+        self.bind("<Configure>", self._layout)
+        self.bind("<Button-1>", lambda e: self.run is not None and command(self.run))
+        self.bind("<Enter>", lambda e: self.itemconfig('bg', fill=self.colors['bg_hover']))
+        self.bind("<Leave>", lambda e: self._paint())
+    
+    def _layout(self, event):
+        """Resize the background and keep the text inset to 5% of the width."""
+        w, h, r = event.width, event.height, self.RADIUS
+        self.coords('bg',
+                    r, 0, w - r, 0, w, 0, w, r, w, h - r, w, h,
+                    w - r, h, r, h, 0, h, 0, h - r, 0, r, 0, 0)
+        x = w * 0.05
+        self.coords('title', x, 22)
+        self.coords('stats', x, 44)
+    
+    def _paint(self):
+        self.itemconfig('bg', fill=self.colors['accent'] if self.selected else self.colors['bg_card'])
+    
+    def set_selected(self, selected: bool):
+        """Highlight or un-highlight the row."""
+        self.selected = selected
+        self._paint()
+    
+    def set_data(self, run, title, stats, selected: bool):
+        """Show a different run in this row."""
+        if run is not self.run:
+            self.run = run
+            self.itemconfig('title', text=title)
+            self.itemconfig('stats', text=stats)
+        self.set_selected(selected)
 
 
 class HistoryTab:
     """History tracker - view Void Cascade runs."""
     
+    RUNS_PAGE_SIZE = 30  # runs fetched per query; more load as the list is scrolled to the end
+    
     def __init__(self, app):
         self.app = app
         self.COLORS = app.COLORS
-        self.db = RelicDatabase()
+        self.db = getattr(app, 'db', None) or RelicDatabase()
         self.runs_detail_tree = None
         self.selected_run = None
         self._drops_style_configured = False
+        self._runs_cache = None
+        self._run_row_widgets = {}  # run id -> currently visible row
+        self._row_slots = {}  # list index -> _RunRow currently placed there
+        self._free_rows = []  # built _RunRow canvases waiting to be recycled
+        self._list_runs = []
+        self._visible_rows_job = None
+        self._runs_stale = True  # list needs a reload next time the tab is shown
+        self._runs_generation = 0  # bumped on invalidation so late query results are dropped
+        self._runs_loading = None  # (generation, offset) of the query in flight, if any
+        self._runs_exhausted = False  # True once a page came back short
+        self._run_render_cache = {}  # run id -> (rows, totals_text) for the details panel
+        self.runs_scroll = None
+        self._shown = False  # set by the app's tab shown/hidden hooks
     
     def create_frame(self, parent) -> ctk.CTkFrame:
         """Create the history tab frame."""
@@ -87,6 +175,13 @@ class HistoryTab:
         ])
         
         self._drops_style_configured = True
+    
+    def _apply_drops_tags(self, tree):
+        """Configure rarity and zebra-stripe row tags on a drops treeview (once per tree)."""
+        for tag, color in DROPS_TAG_COLORS:
+            tree.tag_configure(tag, foreground=color)
+        tree.tag_configure('evenrow', background=self.COLORS['bg_card'])
+        tree.tag_configure('oddrow', background=self.COLORS['bg_secondary'])
 
     def _create_header(self, parent):
         """Create the header."""
@@ -98,7 +193,7 @@ class HistoryTab:
         title = ctk.CTkLabel(
             header,
             text="⚡ Void Cascade History",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=_font(20, "bold"),
             text_color=self.COLORS['text']
         )
         title.grid(row=0, column=0, padx=20, pady=15, sticky="w")
@@ -113,80 +208,230 @@ class HistoryTab:
         header = ctk.CTkLabel(
             panel,
             text="📋 Runs",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
             text_color=self.COLORS['text']
         )
         header.grid(row=0, column=0, padx=15, pady=(15, 10), sticky="w")
         
-        self.runs_scroll = ctk.CTkScrollableFrame(panel, fg_color="transparent")
-        self.runs_scroll.grid(row=1, column=0, sticky="nsew", padx=10, pady=(0, 15))
-        self.runs_scroll.grid_columnconfigure(0, weight=1)
+        # Plain canvas + frame: rows are placed by hand, so CTkScrollableFrame's extra layers buy nothing
+        canvas = tk.Canvas(panel, bg=self.COLORS['bg_secondary'], highlightthickness=0, bd=0,
+                           yscrollincrement=_RunRow.PITCH // 2)
+        canvas.grid(row=1, column=0, sticky="nsew", padx=(10, 0), pady=(0, 15))
+        scrollbar = ttk.Scrollbar(panel, orient="vertical", command=canvas.yview)
+        scrollbar.grid(row=1, column=1, sticky="ns", padx=(0, 5), pady=(0, 15))
+        self._runs_canvas = canvas
+        
+        # Only rows inside the viewport exist; the frame's height is set to the full list height
+        self.runs_scroll = tk.Frame(canvas, bg=self.COLORS['bg_secondary'], height=1)
+        window = canvas.create_window((0, 0), window=self.runs_scroll, anchor="nw")
+        self.runs_scroll.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+        canvas.bind("<Configure>", lambda e: canvas.itemconfigure(window, width=e.width))
+        for widget in (canvas, self.runs_scroll):
+            self._bind_runs_wheel(widget)
+        
+        self._runs_empty = ctk.CTkLabel(
+            self.runs_scroll,
+            text="No runs yet\n\nStart tracking in the\nVoid Cascade tab",
+            font=_font(12),
+            text_color=self.COLORS['text_muted'],
+            justify="center"
+        )
         
-        self._refresh_runs_list()
+        # Any view change (wheel, scrollbar drag, resize) goes through yscrollcommand
+        def on_yscroll(first, last):
+            scrollbar.set(first, last)
+            self._schedule_visible_rows()
+        canvas.configure(yscrollcommand=on_yscroll)
+        # Runs are loaded by on_tab_shown()
+    
+    def _is_shown(self) -> bool:
+        """Whether the History tab is the active page (its frame may not be mapped yet)."""
+        return self._shown and self.runs_scroll is not None
+    
+    def on_tab_shown(self):
+        """Called by the app whenever the History tab is brought to the front."""
+        self._shown = True
+        if not self._runs_stale:
+            return
+        if self._runs_cache is None:
+            self._load_runs_async()
+        else:
+            self._refresh_runs_list()
+    
+    def on_tab_hidden(self):
+        """Called by the app when another page replaces the History tab."""
+        self._shown = False
+    
+    def _load_runs_async(self, offset: int = 0):
+        """Query a page of run history on the app's DB worker and show it when it arrives.
+        
+        offset 0 (re)loads the first page; otherwise the page is appended to the cached runs.
+        """
+        key = (self._runs_generation, offset)
+        if self._runs_loading == key:
+            return
+        self._runs_loading = key
+        future = self.app.db_executor.submit(self._fetch_runs, offset)
+        future.add_done_callback(lambda f: self.app.after(0, self._apply_loaded_runs, f, key))
+    
+    def _fetch_runs(self, offset: int):
+        """Load a page of runs and pre-render their detail rows (runs on the DB worker, no Tk calls)."""
+        runs = self.db.get_run_history(limit=self.RUNS_PAGE_SIZE, offset=offset)
+        return runs, {run['id']: self._render_run(run) for run in runs}
+    
+    def _apply_loaded_runs(self, future, key):
+        """Store queried runs (on the Tk thread) unless they were invalidated in the meantime."""
+        if self._runs_loading == key:
+            self._runs_loading = None
+        generation, offset = key
+        if generation != self._runs_generation:
+            return
+        if offset and (self._runs_cache is None or len(self._runs_cache) != offset):
+            return  # list changed underneath this page
+        try:
+            runs, rendered = future.result()
+            self._run_render_cache.update(rendered)
+        except Exception as e:
+            print(f"Error loading runs: {e}")
+            runs = []
+        self._runs_exhausted = len(runs) < self.RUNS_PAGE_SIZE
+        if offset:
+            self._runs_cache.extend(runs)
+        else:
+            self._runs_cache = runs
+        if self._is_shown():
+            self._refresh_runs_list()
     
     def _refresh_runs_list(self):
         """Refresh the runs list."""
-        for widget in self.runs_scroll.winfo_children():
-            widget.destroy()
-        
-        runs = self.db.get_run_history()
+        self._runs_stale = False
+        self._list_runs = runs = self._runs_cache or []
+        # Indices may now point at different runs, so every row goes back to the free list
+        self._free_rows.extend(self._row_slots.values())
+        self._row_slots.clear()
         
         if not runs:
-            empty = ctk.CTkLabel(
-                self.runs_scroll,
-                text="No runs yet\n\nStart tracking in the\nVoid Cascade tab",
-                font=ctk.CTkFont(size=12),
-                text_color=self.COLORS['text_muted'],
-                justify="center"
-            )
-            empty.grid(row=0, column=0, pady=40)
+            for row in self._free_rows:
+                row.place_forget()
+            self._run_row_widgets.clear()
+            # place() doesn't grow the frame, so make room for the label or Tk clips it away
+            self.runs_scroll.configure(height=self._runs_empty.winfo_reqheight() + 80)
+            self._runs_empty.place(relx=0.5, y=40, anchor="n")
             return
         
-        for i, run in enumerate(runs[:30]):
-            self._create_run_row(run, i)
+        self._runs_empty.place_forget()
+        self.runs_scroll.configure(height=len(runs) * _RunRow.PITCH)
+        self._refresh_visible_rows()
     
-    def _create_run_row(self, run, index):
-        """Create a clickable row for a run."""
-        is_selected = self.selected_run and self.selected_run.get('id') == run.get('id')
-        bg_color = self.COLORS['accent'] if is_selected else self.COLORS['bg_card']
-        
-        row = ctk.CTkButton(
-            self.runs_scroll,
-            text="",
-            fg_color=bg_color,
-            hover_color=self.COLORS['bg_hover'],
-            height=65,
-            corner_radius=8,
-            command=lambda r=run: self._select_run(r)
-        )
-        row.grid(row=index, column=0, sticky="ew", pady=2)
+    def _bind_runs_wheel(self, widget):
+        """Route wheel events on widget to the runs list (X11 reports the wheel as buttons 4/5)."""
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            widget.bind(sequence, self._on_runs_wheel)
+    
+    def _on_runs_wheel(self, event):
+        """Scroll the runs list with the mouse wheel."""
+        self._runs_canvas.yview_scroll(-1 if event.num == 4 or event.delta > 0 else 1, "units")
+    
+    def _schedule_visible_rows(self):
+        """Coalesce scroll/resize notifications into one visible-rows pass."""
+        if self._visible_rows_job is None:
+            self._visible_rows_job = self.runs_scroll.after_idle(self._refresh_visible_rows)
+    
+    def _refresh_visible_rows(self):
+        """Recycle rows that scrolled out of the viewport onto the runs that scrolled in.
+        
+        Rows whose run is still visible are left alone, so a scroll only touches the edges.
+        """
+        self._visible_rows_job = None
+        runs = self._list_runs
+        slots, free = self._row_slots, self._free_rows
+        
+        canvas = self._runs_canvas
+        pitch, row_height = _RunRow.PITCH, _RunRow.HEIGHT
+        top = max(0, int(canvas.canvasy(0)))
+        start = min(len(runs), top // pitch)
+        end = min(len(runs), (top + canvas.winfo_height()) // pitch + 1)
+        
+        for index in [i for i in slots if not start <= i < end]:
+            free.append(slots.pop(index))
+        
+        selected_id = self.selected_run.get('id') if self.selected_run else None
+        for index in range(start, end):
+            if index in slots:
+                continue
+            if free:
+                row = free.pop()
+            else:
+                row = _RunRow(self.runs_scroll, self.COLORS, self._select_run)
+                self._bind_runs_wheel(row)
+            run = runs[index]
+            date_text = run.get('date', '')[:10]
+            drops = len(run.get('rewards') or ())
+            plat = run.get('total_plat', 0)
+            row.set_data(
+                run,
+                title=run.get('title', 'Untitled')[:20],
+                stats=f"{date_text}  •  {drops} drops  •  {plat}p",
+                selected=selected_id is not None and run.get('id') == selected_id
+            )
+            row.place(x=0, y=index * pitch + 2, relwidth=1, height=row_height)
+            slots[index] = row
         
-        inner = ctk.CTkFrame(row, fg_color="transparent")
-        inner.place(relx=0.5, rely=0.5, anchor="center", relwidth=0.9)
-        inner.bind("<Button-1>", lambda e, r=run: self._select_run(r))
+        for row in free:
+            row.place_forget()
         
-        title_text = run.get('title', 'Untitled')[:20]
-        date_text = run.get('date', '')[:10]
-        drops = len(run.get('rewards', []))
-        plat = run.get('total_plat', 0)
+        # Reached the last loaded run: fetch the next page
+        if runs and end >= len(runs) and not self._runs_exhausted:
+            self._load_runs_async(offset=len(runs))
         
-        title_lbl = ctk.CTkLabel(
-            inner,
-            text=title_text,
-            font=ctk.CTkFont(size=12, weight="bold"),
-            text_color=self.COLORS['text']
-        )
-        title_lbl.pack(anchor="w")
-        title_lbl.bind("<Button-1>", lambda e, r=run: self._select_run(r))
-        
-        stats_lbl = ctk.CTkLabel(
-            inner,
-            text=f"{date_text}  •  {drops} drops  •  {plat}p",
-            font=ctk.CTkFont(size=10),
-            text_color=self.COLORS['text_secondary']
-        )
-        stats_lbl.pack(anchor="w")
-        stats_lbl.bind("<Button-1>", lambda e, r=run: self._select_run(r))
+        self._run_row_widgets = {runs[i].get('id'): row for i, row in slots.items()}
+    
+    def invalidate_runs(self):
+        """Forget cached runs; call after runs are added or removed.
+        
+        The list is rebuilt now if it's on screen, otherwise when the tab is next shown.
+        """
+        self._runs_cache = None
+        self._runs_generation += 1
+        self._runs_stale = True
+        if self._is_shown():
+            self._load_runs_async()
+    
+    def runs_added(self):
+        """Fetch only the runs saved since the newest cached one; call after saving a run."""
+        if self._runs_cache is None:
+            if self._runs_loading is not None:
+                self.invalidate_runs()  # the query in flight may predate the new run
+            return  # otherwise nothing is loaded yet, and the first load will include them
+        newest_id = self._runs_cache[0]['id'] if self._runs_cache else 0
+        generation = self._runs_generation
+        future = self.app.db_executor.submit(self._fetch_runs_since, newest_id)
+        future.add_done_callback(lambda f: self.app.after(0, self._apply_added_runs, f, generation))
+    
+    def _fetch_runs_since(self, last_id: int):
+        """Load and pre-render the runs saved after last_id (runs on the DB worker, no Tk calls)."""
+        runs = self.db.get_run_history_since(last_id)
+        return runs, {run['id']: self._render_run(run) for run in runs}
+    
+    def _apply_added_runs(self, future, generation):
+        """Prepend newly saved runs (on the Tk thread) unless the list was invalidated meanwhile."""
+        if generation != self._runs_generation or self._runs_cache is None:
+            return
+        try:
+            runs, rendered = future.result()
+        except Exception as e:
+            print(f"Error loading new runs: {e}")
+            return
+        # An earlier call may already have prepended some of these
+        newest_id = self._runs_cache[0]['id'] if self._runs_cache else 0
+        new_runs = [run for run in runs if run['id'] > newest_id]
+        if not new_runs:
+            return
+        self._run_render_cache.update(rendered)
+        self._runs_cache[:0] = new_runs
+        self._runs_stale = True
+        if self._is_shown():
+            self._refresh_runs_list()
     
     def _create_run_details_panel(self):
         """Create the run details panel."""
@@ -195,65 +440,83 @@ class HistoryTab:
         self.details_panel.grid_columnconfigure(0, weight=1)
         self.details_panel.grid_rowconfigure(1, weight=1)
         
-        self._show_empty_run_details()
-    
-    def _show_empty_run_details(self):
-        """Show empty state for run details."""
-        for widget in self.details_panel.winfo_children():
-            widget.destroy()
-        
-        empty = ctk.CTkLabel(
+        self._details_empty = ctk.CTkLabel(
             self.details_panel,
             text="⚡\n\nSelect a run to view details",
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             text_color=self.COLORS['text_muted'],
             justify="center"
         )
-        empty.place(relx=0.5, rely=0.5, anchor="center")
+        self._details_header = None  # built on first selection
+        
+        self._show_empty_run_details()
+    
+    def _show_empty_run_details(self):
+        """Show empty state for run details."""
+        if self._details_header is not None:
+            self._details_header.grid_remove()
+            self._details_tree_container.grid_remove()
+            self._details_totals.grid_remove()
+        self._details_empty.place(relx=0.5, rely=0.5, anchor="center")
     
     def _select_run(self, run):
         """Select a run to view details."""
+        # Only the previous and new selection change colour
+        if self.selected_run:
+            prev_row = self._run_row_widgets.get(self.selected_run.get('id'))
+            if prev_row:
+                prev_row.set_selected(False)
         self.selected_run = run
-        self._refresh_runs_list()
+        row = self._run_row_widgets.get(run.get('id'))
+        if row:
+            row.set_selected(True)
         self._show_run_details(run)
     
     def _show_run_details(self, run):
         """Show details of a selected run."""
-        for widget in self.details_panel.winfo_children():
-            widget.destroy()
-        
-        self.details_panel.grid_rowconfigure(1, weight=1)
+        self._ensure_details_widgets()
+        self._details_empty.place_forget()
+        self._details_header.grid()
+        self._details_tree_container.grid()
+        self._details_totals.grid()
+        self._populate_details(run)
+    
+    def _ensure_details_widgets(self):
+        """Build the details header, drops treeview and totals once; later selections reuse them."""
+        if self._details_header is not None:
+            return
+        C = self.COLORS
         
         # Header
         header = ctk.CTkFrame(self.details_panel, fg_color="transparent")
         header.grid(row=0, column=0, sticky="ew", padx=20, pady=(15, 10))
         header.grid_columnconfigure(1, weight=1)
         
-        title = ctk.CTkLabel(
+        self._details_title = ctk.CTkLabel(
             header,
-            text=run.get('title', 'Untitled Run'),
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=self.COLORS['text']
+            text="",
+            font=_font(16, "bold"),
+            text_color=C['text']
         )
-        title.grid(row=0, column=0, sticky="w")
+        self._details_title.grid(row=0, column=0, sticky="w")
         
-        date = ctk.CTkLabel(
+        self._details_date = ctk.CTkLabel(
             header,
-            text=run.get('date', ''),
-            font=ctk.CTkFont(size=11),
-            text_color=self.COLORS['text_muted']
+            text="",
+            font=_font(11),
+            text_color=C['text_muted']
         )
-        date.grid(row=0, column=1, padx=15, sticky="w")
+        self._details_date.grid(row=0, column=1, padx=15, sticky="w")
         
         delete_btn = ctk.CTkButton(
             header,
             text="🗑️",
-            font=ctk.CTkFont(size=14),
-            fg_color=self.COLORS['bg_card'],
-            hover_color=self.COLORS['error'],
+            font=_font(14),
+            fg_color=C['bg_card'],
+            hover_color=C['error'],
             width=36,
             height=32,
-            command=lambda: self._delete_run(run)
+            command=lambda: self._delete_run(self.selected_run)
         )
         delete_btn.grid(row=0, column=2)
         
@@ -261,7 +524,7 @@ class HistoryTab:
         self._setup_drops_treeview_style()
         
         # Drops treeview container
-        tree_container = ctk.CTkFrame(self.details_panel, fg_color=self.COLORS['bg_card'], corner_radius=8)
+        tree_container = ctk.CTkFrame(self.details_panel, fg_color=C['bg_card'], corner_radius=8)
         tree_container.grid(row=1, column=0, sticky="nsew", padx=15, pady=(5, 10))
         tree_container.grid_columnconfigure(0, weight=1)
         tree_container.grid_rowconfigure(0, weight=1)
@@ -282,94 +545,111 @@ class HistoryTab:
         self.runs_detail_tree.column("item", width=300, minwidth=200, anchor="w")
         self.runs_detail_tree.column("values", width=100, minwidth=80, anchor="e")
         
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(tree_container, orient="vertical", command=self.runs_detail_tree.yview)
-        self.runs_detail_tree.configure(yscrollcommand=scrollbar.set)
+        # Scrollbar (yscrollcommand is hooked up after each bulk insert)
+        self._details_scrollbar = ttk.Scrollbar(tree_container, orient="vertical", command=self.runs_detail_tree.yview)
         
         self.runs_detail_tree.grid(row=0, column=0, sticky="nsew", padx=(10, 0), pady=10)
-        scrollbar.grid(row=0, column=1, sticky="ns", pady=10, padx=(0, 5))
+        self._details_scrollbar.grid(row=0, column=1, sticky="ns", pady=10, padx=(0, 5))
         
-        # Configure row tags for rarity colors
-        self.runs_detail_tree.tag_configure('rare', foreground='#ffd700')
-        self.runs_detail_tree.tag_configure('uncommon', foreground='#c0c0c0')
-        self.runs_detail_tree.tag_configure('common', foreground='#cd7f32')
-        self.runs_detail_tree.tag_configure('forma', foreground='#60a5fa')
-        self.runs_detail_tree.tag_configure('evenrow', background=self.COLORS['bg_card'])
-        self.runs_detail_tree.tag_configure('oddrow', background=self.COLORS['bg_secondary'])
+        self._apply_drops_tags(self.runs_detail_tree)
+        
+        # Totals with G/S/B counter
+        totals = ctk.CTkFrame(self.details_panel, fg_color=C['bg_card'], corner_radius=8)
+        totals.grid(row=2, column=0, sticky="ew", padx=15, pady=(0, 15))
         
-        rewards = run.get('rewards', [])
-        gold_count = 0
-        silver_count = 0
-        bronze_count = 0
+        self._details_totals_label = ctk.CTkLabel(
+            totals,
+            text="",
+            font=_font(13, "bold"),
+            text_color=C['text']
+        )
+        self._details_totals_label.pack(pady=10)
+        
+        self._details_header = header
+        self._details_tree_container = tree_container
+        self._details_totals = totals
+    
+    def _populate_details(self, run):
+        """Fill the existing details widgets with a run's drops and totals."""
+        self._details_title.configure(text=run.get('title', 'Untitled Run'))
+        self._details_date.configure(text=run.get('date', ''))
+        
+        # Consolidated/sorted rows are cached per run, so revisits skip straight to inserting
+        run_id = run.get('id')
+        cached = self._run_render_cache.get(run_id)
+        if cached is None:
+            cached = self._render_run(run)
+            if run_id is not None:
+                self._run_render_cache[run_id] = cached
+        rows, totals_text = cached
+        
+        tree = self.runs_detail_tree
+        # Freeze: unmap the tree and detach the scrollbar while it's refilled
+        tree.grid_remove()
+        tree.configure(yscrollcommand="")
+        tree.delete(*tree.get_children())
+        # Call the Tcl insert command directly; Treeview.insert's option formatting adds up per row
+        tcl_call, tree_cmd = tree.tk.call, tree._w
+        for item_text, value_text, tags in rows:
+            tcl_call(tree_cmd, 'insert', '', 'end',
+                     '-values', (item_text, value_text), '-tags', tags)
+        
+        tree.yview_moveto(0)
+        tree.configure(yscrollcommand=self._details_scrollbar.set)
+        self._details_scrollbar.set(*tree.yview())
+        
+        self._details_totals_label.configure(text=totals_text)
+        
+        # Thaw: map it again and repaint the panel once
+        tree.grid()
+        self.details_panel.update_idletasks()
+    
+    def _render_run(self, run):
+        """Consolidate and sort a run's drops into (rows, totals_text) for the details panel."""
+        rewards = run.get('rewards') or []
+        total_drops = len(rewards)
+        rows = []
+        # Quantities per RARITY_ORDER slot: Rare, Uncommon, Common, Forma/other
+        counts = array('i', (0, 0, 0, 0))
         
         if rewards:
-            # Consolidate duplicates
+            # Consolidate duplicates: item -> (rarity, plat, ducats, qty)
+            # The first drop of each item supplies its rarity/values
             consolidated = {}
             for drop in rewards:
                 item = drop.get('item', drop.get('name', 'Unknown'))
-                if item in consolidated:
-                    consolidated[item]['qty'] += 1
-                else:
-                    consolidated[item] = {
-                        'rarity': drop.get('rarity', 'Common'),
-                        'plat': drop.get('plat', 0),
-                        'ducats': drop.get('ducats', 0),
-                        'qty': 1
-                    }
+                entry = consolidated.setdefault(
+                    item, [drop.get('rarity', 'Common'), drop.get('plat', 0), drop.get('ducats', 0), 0]
+                )
+                entry[3] += 1
             
             # Sort by rarity: Rare -> Uncommon -> Common -> Forma
-            rarity_order = {'Rare': 0, 'Uncommon': 1, 'Common': 2, 'Forma Blueprint': 3}
             sorted_items = sorted(
                 consolidated.items(),
-                key=lambda x: (rarity_order.get(x[1]['rarity'], 2), x[0])
+                key=lambda x: (RARITY_ORDER.get(x[1][0], 2), x[0])
             )
             
-            # Insert rows
-            for i, (item_name, data) in enumerate(sorted_items):
-                rarity = data['rarity']
-                qty = data['qty']
-                total_plat = data['plat'] * qty
-                total_ducats = data['ducats'] * qty
+            for i, (item_name, (rarity, plat, ducats, qty)) in enumerate(sorted_items):
+                total_plat = plat * qty
+                total_ducats = ducats * qty
                 
-                # Count by rarity
-                if rarity == 'Rare':
-                    gold_count += qty
-                elif rarity == 'Uncommon':
-                    silver_count += qty
-                elif rarity == 'Common':
-                    bronze_count += qty
+                counts[RARITY_ORDER.get(rarity, 3)] += qty
                 
                 # Determine tag
-                if rarity == 'Rare':
-                    tag = 'rare'
-                elif rarity == 'Uncommon':
-                    tag = 'uncommon'
-                elif rarity == 'Forma Blueprint' or 'Forma' in item_name:
-                    tag = 'forma'
-                else:
-                    tag = 'common'
-                
-                row_tag = 'evenrow' if i % 2 == 0 else 'oddrow'
+                tag = RARITY_TAG.get(rarity) or ('forma' if 'Forma' in item_name else 'common')
+                tags = ROW_TAGS[tag][i % 2]
                 
                 qty_text = f" x{qty}" if qty > 1 else ""
                 item_text = f"● {item_name}{qty_text}"
                 value_text = f"{total_plat}p • {total_ducats}d"
                 
-                self.runs_detail_tree.insert(
-                    "", "end",
-                    values=(item_text, value_text),
-                    tags=(tag, row_tag)
-                )
+                rows.append((item_text, value_text, tags))
         
-        # Totals with G/S/B counter
-        totals = ctk.CTkFrame(self.details_panel, fg_color=self.COLORS['bg_card'], corner_radius=8)
-        totals.grid(row=2, column=0, sticky="ew", padx=15, pady=(0, 15))
-        
-        total_drops = len(rewards)
         total_plat = run.get('total_plat', 0)
         total_ducats = run.get('total_ducats', 0)
         
         # Build totals text with G/S/B
+        gold_count, silver_count, bronze_count = counts[0], counts[1], counts[2]
         gsb_parts = []
         if gold_count > 0:
             gsb_parts.append(f"🥇{gold_count}")
@@ -379,16 +659,10 @@ class HistoryTab:
             gsb_parts.append(f"🥉{bronze_count}")
         gsb_text = " ".join(gsb_parts) + "  •  " if gsb_parts else ""
         
-        ctk.CTkLabel(
-            totals,
-            text=f"{gsb_text}{total_drops} drops  •  {total_plat}p  •  {total_ducats} ducats",
-            font=ctk.CTkFont(size=13, weight="bold"),
-            text_color=self.COLORS['text']
-        ).pack(pady=10)
+        return rows, f"{gsb_text}{total_drops} drops  •  {total_plat}p  •  {total_ducats} ducats"
     
     def _delete_run(self, run):
         """Delete a cascade run."""
-        from tkinter import messagebox
         if not messagebox.askyesno("Delete Run", f"Delete '{run.get('title', 'this run')}'?"):
             return
         
@@ -396,8 +670,9 @@ class HistoryTab:
             run_id = run.get('id')
             if run_id:
                 self.db.delete_run(run_id)
+                self._run_render_cache.pop(run_id, None)
                 self.selected_run = None
-                self._refresh_runs_list()
+                self.invalidate_runs()
                 self._show_empty_run_details()
         except Exception as e:
             print(f"Error deleting run: {e}")
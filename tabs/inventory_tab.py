@@ -32,6 +32,10 @@ class InventoryTab:
         self.cascade_label = None
         self.wfcd_db = WFCDRelicDatabase()
         self._price_cache = {}  # Cache relic -> price lookups
+        self._search_job = None  # Pending debounced search refresh
+        self._tree_state = {}  # iid -> (values, tags) currently shown in inv_tree
+        self._row_keys = {}  # iid -> app inventory key (era, name, refinement)
+        self._search_index = {}  # (relic name, refinement) -> lowercased search fields
     
     def create_frame(self, parent):
         """Create the inventory management frame."""
@@ -115,7 +119,7 @@ class InventoryTab:
             border_color=self.COLORS['border']
         )
         self.inv_search.pack(side="left", padx=15, pady=12)
-        self.inv_search.bind("<KeyRelease>", lambda e: self.refresh_inventory())
+        self.inv_search.bind("<KeyRelease>", self._schedule_search_refresh)
         
         # Era filter
         era_label = ctk.CTkLabel(filter_frame, text="Era:",
@@ -352,27 +356,37 @@ class InventoryTab:
             rare_items = self.wfcd_db.get_all_rare_items()
             for item in rare_items:
                 self._relic_rare_cache[item.relic_full] = item.item_name
+            # Lowercased search fields include the rare drop, so rebuild them lazily
+            self._search_index = {}
         except Exception as e:
             print(f"Error loading price cache: {e}")
             self._price_cache = {}
             self._relic_rare_cache = {}
+            self._search_index = {}
     
     def get_relic_gold_price(self, relic) -> int:
         """Get the price of the gold (rare) drop from a relic."""
         if not relic:
             return 0
         
-        # Build relic full name (e.g., "Axi A11")
-        relic_full = f"{relic.era.value} {relic.name}"
-        
-        # Look up the rare item from WFCD database
-        rare_item_name = self._relic_rare_cache.get(relic_full)
+        # Look up the rare item from WFCD database by full name (e.g., "Axi A11")
+        rare_item_name = self._relic_rare_cache.get(relic.full_name)
         if not rare_item_name:
             return 0
         
         # Look up the price
         return self._price_cache.get(rare_item_name, 0)
     
+    def _schedule_search_refresh(self, event=None):
+        """Refresh shortly after typing pauses so a burst of keys triggers one refresh."""
+        if self._search_job:
+            self.app.after_cancel(self._search_job)
+        self._search_job = self.app.after(150, self._run_search_refresh)
+    
+    def _run_search_refresh(self):
+        self._search_job = None
+        self.refresh_inventory()
+    
     def on_filter_change(self):
         """Handle filter change - save and refresh."""
         self.save_filter_preferences()
@@ -444,30 +458,19 @@ class InventoryTab:
         if not selection:
             return
         
-        item_id = selection[0]
-        # Find the inventory item by matching the tree item
-        values = self.inv_tree.item(item_id, 'values')
-        # Columns: relic, gold_drop, price, refinement, quantity
-        relic_name, gold_drop, price, ref, qty = values
-        # Parse era and name from combined relic column
-        parts = relic_name.split(' ', 1)
-        era = parts[0] if len(parts) > 0 else ''
-        name = parts[1] if len(parts) > 1 else ''
-        
-        for inv_item in self.app.inventory:
-            if (inv_item.relic and 
-                inv_item.relic.era.value == era and 
-                inv_item.relic.name == name and
-                inv_item.refinement.value == ref):
-                inv_item.quantity += delta
-                
-                # Log to history
-                action = 'added' if delta > 0 else 'removed'
-                self.app.db.log_relic_action(action, era, name, ref, abs(delta))
-                
-                if inv_item.quantity <= 0:
-                    self.app.inventory.remove(inv_item)
-                break
+        # Find the inventory item through the row's key instead of scanning the inventory
+        key = self._row_keys.get(selection[0])
+        inv_item = self.app.get_inventory_item(key) if key else None
+        if inv_item:
+            era, name, ref = key
+            inv_item.quantity += delta
+            
+            # Log to history
+            action = 'added' if delta > 0 else 'removed'
+            self.app.db.log_relic_action(action, era, name, ref, abs(delta))
+            
+            if inv_item.quantity <= 0:
+                self.app.remove_inventory_item(inv_item)
         
         self.app.save_inventory()
         self.refresh_inventory()
@@ -478,24 +481,13 @@ class InventoryTab:
         if not selection:
             return
         
-        item_id = selection[0]
-        values = self.inv_tree.item(item_id, 'values')
-        # Columns: relic, gold_drop, price, refinement, quantity
-        relic_name, gold_drop, price, ref, qty = values
-        # Parse era and name from combined relic column
-        parts = relic_name.split(' ', 1)
-        era = parts[0] if len(parts) > 0 else ''
-        name = parts[1] if len(parts) > 1 else ''
-        
-        for inv_item in self.app.inventory:
-            if (inv_item.relic and 
-                inv_item.relic.era.value == era and 
-                inv_item.relic.name == name and
-                inv_item.refinement.value == ref):
-                # Log to history before removing
-                self.app.db.log_relic_action('removed', era, name, ref, inv_item.quantity)
-                self.app.inventory.remove(inv_item)
-                break
+        key = self._row_keys.get(selection[0])
+        inv_item = self.app.get_inventory_item(key) if key else None
+        if inv_item:
+            era, name, ref = key
+            # Log to history before removing
+            self.app.db.log_relic_action('removed', era, name, ref, inv_item.quantity)
+            self.app.remove_inventory_item(inv_item)
         
         self.app.save_inventory()
         self.refresh_inventory()
@@ -504,11 +496,7 @@ class InventoryTab:
         """Refresh the inventory display."""
         print(f"DEBUG refresh_inventory: app.inventory has {len(self.app.inventory)} items")
         
-        # Clear existing items
-        if hasattr(self, 'inv_tree') and self.inv_tree:
-            for item in self.inv_tree.get_children():
-                self.inv_tree.delete(item)
-        else:
+        if not (hasattr(self, 'inv_tree') and self.inv_tree):
             print("DEBUG: inv_tree not ready, returning")
             return
         
@@ -517,6 +505,12 @@ class InventoryTab:
         era_filter = self.inv_era_filter.get() if self.inv_era_filter else "All"
         sort_by = self.inv_sort.get() if self.inv_sort else "Quantity ↓"
         
+        # Resolve each item's gold-drop price once; filters, sort and insert all reuse it
+        get_price = self.get_relic_gold_price
+        prices = {id(item): get_price(item.relic) for item in self.app.inventory}
+        rare_for = self._relic_rare_cache.get
+        search_index = self._search_index
+        
         # Filter inventory
         filtered = []
         for item in self.app.inventory:
@@ -537,29 +531,29 @@ class InventoryTab:
                     if item.refinement.value == "Intact":
                         continue
                 else:
-                    relic_name = f"{item.relic.era.value} {item.relic.name}".lower() if item.relic else ""
-                    
-                    # Get rare drop name from WFCD cache (most reliable source)
-                    rare_drop = ""
-                    if item.relic:
-                        relic_full = f"{item.relic.era.value} {item.relic.name}"
-                        rare_drop = self._relic_rare_cache.get(relic_full, "").lower()
-                    
-                    # Get refinement name
-                    refinement = item.refinement.value.lower() if item.refinement else ""
+                    relic_full = item.relic.full_name if item.relic else ""
+                    fields = search_index.get((relic_full, item.refinement))
+                    if fields is None:
+                        # Relic name, rare drop name from WFCD cache (most reliable source), refinement
+                        fields = search_index[relic_full, item.refinement] = (
+                            relic_full.lower(),
+                            rare_for(relic_full, "").lower() if item.relic else "",
+                            item.refinement.value.lower() if item.refinement else "",
+                        )
+                    relic_name, rare_drop, refinement = fields
                     
                     if search_query not in relic_name and search_query not in rare_drop and search_query not in refinement:
                         continue
             
             # Profit filter - only show relics with 20p+ gold parts
             if self.profit_enabled:
-                gold_price = self.get_relic_gold_price(item.relic)
+                gold_price = prices[id(item)]
                 if gold_price < 20:
                     continue
             
             # Ducats filter - only show relics with gold parts worth less than 18p
             if self.ducats_enabled:
-                gold_price = self.get_relic_gold_price(item.relic)
+                gold_price = prices[id(item)]
                 if gold_price >= 18:
                     continue
             
@@ -574,9 +568,9 @@ class InventoryTab:
             elif sort_by == "Quantity ↑":
                 filtered.sort(key=lambda x: x.quantity)
             elif sort_by == "Plat ↓":
-                filtered.sort(key=lambda x: self.get_relic_gold_price(x.relic), reverse=True)
+                filtered.sort(key=lambda x: -prices[id(x)])
             elif sort_by == "Plat ↑":
-                filtered.sort(key=lambda x: self.get_relic_gold_price(x.relic))
+                filtered.sort(key=lambda x: prices[id(x)])
         except Exception as e:
             print(f"DEBUG: Sort error: {e}")
         
@@ -623,33 +617,58 @@ class InventoryTab:
                 text=f"⚡ Void Cascade: {cascade_runs} runs ({radiant_count} Radiant)"
             )
         
-        # Insert items into treeview with alternating row colors
+        # Build the wanted rows, keyed by a stable iid per (era, name, refinement)
+        new_state = {}
+        row_keys = {}
         for idx, item in enumerate(filtered):
             if item.relic:
                 era = item.relic.era.value
                 name = item.relic.name
-                relic_full = f"{era} {name}"
-                gold_drop = self._relic_rare_cache.get(relic_full, "—")
-                price = self.get_relic_gold_price(item.relic)
+                # Combined relic name (e.g., "Meso N14")
+                relic_combined = item.relic.full_name
+                gold_drop = rare_for(relic_combined, "—")
+                price = prices[id(item)]
                 price_str = f"{price}p" if price > 0 else "—"
             else:
                 era = "?"
                 name = "Unknown"
+                relic_combined = "? Unknown"
                 gold_drop = "—"
                 price_str = "—"
             
+            iid = f"{era}|{name}|{item.refinement.value}"
+            if iid in new_state:
+                iid = f"{iid}|{idx}"
+            if item.relic:
+                row_keys[iid] = (era, name, item.refinement.value)
+            
             # Apply alternating row tag
             row_tag = 'oddrow' if idx % 2 == 1 else 'evenrow'
             
-            # Combined relic name (e.g., "Meso N14")
-            relic_combined = f"{era} {name}"
-            
-            self.inv_tree.insert('', 'end', values=(
+            new_state[iid] = ((
                 relic_combined,
                 gold_drop,
                 price_str,
                 item.refinement.value,
                 item.quantity
-            ), tags=(row_tag,))
+            ), (row_tag,))
+        
+        # Only touch the rows that changed; a +1/-1 edit updates a single row
+        tree = self.inv_tree
+        old_state = self._tree_state
+        removed = [iid for iid in old_state if iid not in new_state]
+        if removed:
+            tree.delete(*removed)
+        for iid, (values, tags) in new_state.items():
+            old = old_state.get(iid)
+            if old is None:
+                tree.insert('', 'end', iid=iid, values=values, tags=tags)
+            elif old != (values, tags):
+                tree.item(iid, values=values, tags=tags)
+        order = list(new_state)
+        if list(tree.get_children()) != order:
+            tree.set_children('', *order)
+        self._tree_state = new_state
+        self._row_keys = row_keys
         
         print(f"DEBUG: Inserted {len(filtered)} items, treeview has {len(self.inv_tree.get_children())} children")
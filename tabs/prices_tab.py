@@ -6,9 +6,19 @@ import customtkinter as ctk
 from tkinter import ttk
 import threading
 import time
+from functools import lru_cache
 from api import PriceData, WFCDRelicDatabase, WarframeMarketAPI, convert_to_url_name
 
 
+@lru_cache(maxsize=2048, typed=True)
+def _plat_text(value, spec: str = "") -> str:
+    """Price cell text such as '35p' or '34.5p', or '-' when there's no price.
+    
+    Prices repeat a lot across items and refreshes, so the strings are cached.
+    """
+    return f"{value:{spec}}p" if value else "-"
+
+
 class PricesTab:
     """Price check tab functionality with database price sync."""
     
@@ -22,6 +32,8 @@ class PricesTab:
         self.sync_progress = None
         self.wfcd_db = WFCDRelicDatabase()
         self._syncing = False
+        self._refresh_job = None
+        self._prices_generation = 0  # bumped per refresh so superseded results are dropped
     
     def create_frame(self, parent):
         """Create the price check frame."""
@@ -138,7 +150,7 @@ class PricesTab:
             width=130,
             height=38,
             fg_color=self.COLORS['bg_card'],
-            command=self.refresh_prices_table
+            command=self._schedule_refresh
         )
         sort_combo.grid(row=0, column=1)
         
@@ -378,63 +390,97 @@ class PricesTab:
         threading.Thread(target=do_sync, daemon=True).start()
     
     def refresh_prices_table(self, *args):
-        """Refresh the prices table from database."""
+        """Refresh the prices table from database.
+        
+        The query, filter, sort and formatting run on the app's DB worker; the
+        table is refilled on the Tk thread once the rows are ready.
+        """
         if not self.prices_tree:
             return
         
-        # Clear existing items
-        for item in self.prices_tree.get_children():
-            self.prices_tree.delete(item)
+        filter_text = self.filter_entry.get().lower() if self.filter_entry else ""
+        sort_by = self.sort_var.get() if hasattr(self, 'sort_var') else "Price (High)"
+        
+        self._prices_generation += 1
+        generation = self._prices_generation
+        future = self.app.db_executor.submit(self._build_price_rows, filter_text, sort_by)
+        future.add_done_callback(lambda f: self.app.after(0, self._apply_price_rows, f, generation))
+    
+    def _build_price_rows(self, filter_text: str, sort_by: str) -> list[tuple]:
+        """Query, filter, sort and format the price table rows (runs on the DB worker)."""
+        # Get prices with relic info
+        prices = self.wfcd_db.get_prices_for_rare_items()
+        
+        # Filter by item name OR relic name
+        if filter_text:
+            filtered_prices = []
+            for p in prices:
+                item_name = p['item_name'].lower()
+                relics = (p['relics'] or "").lower()
+                # Match if filter text is in item name OR in relics column
+                if filter_text in item_name or filter_text in relics:
+                    filtered_prices.append(p)
+            prices = filtered_prices
+        
+        # Sort
+        if sort_by == "Price (High)":
+            prices.sort(key=lambda x: x['lowest_price'] or 0, reverse=True)
+        elif sort_by == "Price (Low)":
+            prices.sort(key=lambda x: x['lowest_price'] or 999999)
+        elif sort_by == "Name (A-Z)":
+            prices.sort(key=lambda x: x['item_name'])
+        elif sort_by == "Name (Z-A)":
+            prices.sort(key=lambda x: x['item_name'], reverse=True)
+        
+        # Format every row here so the Tk-side insert loop is only Tk calls
+        return [
+            (
+                item['item_name'],
+                _plat_text(item['lowest_price']),
+                _plat_text(item['avg_price'], ".1f"),
+                item['relics'] or ""
+            )
+            for item in prices
+        ]
+    
+    def _apply_price_rows(self, future, generation: int):
+        """Refill the prices table with built rows, unless a newer refresh superseded them."""
+        if generation != self._prices_generation:
+            return
+        
+        # Clear existing items; the tree stays unmapped until it's refilled,
+        # so it lays out and redraws once instead of tracking every insert
+        tree = self.prices_tree
+        tree.grid_remove()
+        tree.delete(*tree.get_children())
         
         try:
-            # Get prices with relic info
-            prices = self.wfcd_db.get_prices_for_rare_items()
-            
-            # Filter by item name OR relic name
-            filter_text = self.filter_entry.get().lower() if self.filter_entry else ""
-            if filter_text:
-                filtered_prices = []
-                for p in prices:
-                    item_name = p['item_name'].lower()
-                    relics = (p['relics'] or "").lower()
-                    # Match if filter text is in item name OR in relics column
-                    if filter_text in item_name or filter_text in relics:
-                        filtered_prices.append(p)
-                prices = filtered_prices
-            
-            # Sort
-            sort_by = self.sort_var.get() if hasattr(self, 'sort_var') else "Price (High)"
-            
-            if sort_by == "Price (High)":
-                prices.sort(key=lambda x: x['lowest_price'] or 0, reverse=True)
-            elif sort_by == "Price (Low)":
-                prices.sort(key=lambda x: x['lowest_price'] or 999999)
-            elif sort_by == "Name (A-Z)":
-                prices.sort(key=lambda x: x['item_name'])
-            elif sort_by == "Name (Z-A)":
-                prices.sort(key=lambda x: x['item_name'], reverse=True)
+            rows = future.result()
             
-            # Populate table with alternating row colors
-            for idx, item in enumerate(prices):
-                lowest = f"{item['lowest_price']}p" if item['lowest_price'] else "-"
-                avg = f"{item['avg_price']:.1f}p" if item['avg_price'] else "-"
-                relics = item['relics'] or ""
-                
-                # Apply alternating row tag
-                row_tag = 'oddrow' if idx % 2 == 1 else 'evenrow'
-                
-                self.prices_tree.insert("", "end", values=(
-                    item['item_name'],
-                    lowest,
-                    avg,
-                    relics
-                ), tags=(row_tag,))
+            # Populate table with alternating row colors, calling the Tcl insert
+            # command directly to skip Treeview.insert's per-row option formatting
+            tcl_call, tree_cmd = tree.tk.call, tree._w
+            row_tags = ('evenrow', 'oddrow')
+            for idx, values in enumerate(rows):
+                tcl_call(tree_cmd, 'insert', '', 'end', '-values', values, '-tags', row_tags[idx % 2])
                 
         except Exception as e:
             print(f"Error refreshing prices: {e}")
+        finally:
+            tree.grid()
     
     def filter_prices(self, event=None):
         """Filter prices table based on search."""
+        self._schedule_refresh()
+    
+    def _schedule_refresh(self, *args):
+        """Refresh the table shortly after the filter/sort stops changing (bursts collapse into one)."""
+        if self._refresh_job:
+            self.app.after_cancel(self._refresh_job)
+        self._refresh_job = self.app.after(150, self._run_scheduled_refresh)
+    
+    def _run_scheduled_refresh(self):
+        self._refresh_job = None
         self.refresh_prices_table()
     
     def on_row_double_click(self, event):
@@ -4,11 +4,21 @@ Track drops earned during Void Cascade runs.
 """
 
 import customtkinter as ctk
-from tkinter import ttk
+from tkinter import ttk, messagebox
 import tkinter as tk
 from datetime import datetime
 from api import WFCDRelicDatabase
 from database import RelicDatabase
+from ui_fonts import get_font as _font
+
+
+# Finish-preview rarity badges, in display order
+_RARITY_BADGES = (
+    ("Rare", "🥇"),
+    ("Uncommon", "🥈"),
+    ("Common", "🥉"),
+    ("Forma Blueprint", "⚙"),
+)
 
 
 class VoidCascadeTab:
@@ -21,12 +31,30 @@ class VoidCascadeTab:
         "Forma Blueprint": 0,
     }
     
+    # Sort order: Rare -> Uncommon -> Common -> Forma
+    RARITY_ORDER = {"Rare": 0, "Uncommon": 1, "Common": 2, "Forma Blueprint": 3}
+    
+    RARITY_COLORS = {
+        "Common": "#cd7f32",
+        "Uncommon": "#c0c0c0",
+        "Rare": "#ffd700",
+        "Forma Blueprint": "#60a5fa",
+    }
+    
+    RARITY_TAGS = {
+        "Rare": "rare",
+        "Uncommon": "uncommon",
+        "Common": "common",
+        "Forma Blueprint": "forma",
+    }
+    
     def __init__(self, app):
         self.app = app
         self.COLORS = app.COLORS
         self.wfcd_db = WFCDRelicDatabase()
-        self.db = RelicDatabase()
+        self.db = getattr(app, 'db', None) or RelicDatabase()
         self._all_items = []
+        self._search_items = []  # (lowercased name, name, rarity), one entry per item name
         self._price_cache = {}
         self._ducat_cache = {}
         self._load_data()
@@ -42,9 +70,18 @@ class VoidCascadeTab:
             all_items = self.wfcd_db.get_all_relic_items()
             self._all_items = [(item['item_name'], item.get('rarity', 'Common')) for item in all_items]
             self._all_items.append(("Forma Blueprint", "Forma Blueprint"))
-            rarity_order = {"Rare": 0, "Uncommon": 1, "Common": 2, "Forma Blueprint": 3}
+            rarity_order = self.RARITY_ORDER
             self._all_items.sort(key=lambda x: (x[0], rarity_order.get(x[1], 2)))
             
+            # Lowercase and de-duplicate once here rather than on every keystroke;
+            # the sort above puts each name's best rarity first, which is the one kept
+            seen = set()
+            self._search_items = []
+            for item_name, rarity in self._all_items:
+                if item_name not in seen:
+                    seen.add(item_name)
+                    self._search_items.append((item_name.lower(), item_name, rarity))
+            
             prices = self.wfcd_db.get_all_prices()
             self._price_cache = {p['item_name']: p['lowest_price'] or 0 for p in prices}
             self._ducat_cache = self.wfcd_db.get_all_ducats()
@@ -71,8 +108,9 @@ class VoidCascadeTab:
     def _save_run(self, run_data):
         """Save a run to the database."""
         try:
-            self.db.save_run(run_data)
-            self.run_history = self._load_history()
+            run_id = self.db.save_run(run_data)
+            self.app.history_tab.runs_added()
+            self.run_history.insert(0, {**run_data, 'id': run_id})
         except Exception as e:
             print(f"Error saving run: {e}")
     
@@ -106,7 +144,7 @@ class VoidCascadeTab:
         title = ctk.CTkLabel(
             header,
             text="⚡ Void Cascade Tracker",
-            font=ctk.CTkFont(size=22, weight="bold"),
+            font=_font(22, "bold"),
             text_color=self.COLORS['text']
         )
         title.grid(row=0, column=0, padx=20, pady=15, sticky="w")
@@ -115,7 +153,7 @@ class VoidCascadeTab:
         self.status_label = ctk.CTkLabel(
             header,
             text="Ready to track",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             text_color=self.COLORS['text_muted']
         )
         self.status_label.grid(row=0, column=1, padx=20, pady=15, sticky="w")
@@ -124,7 +162,7 @@ class VoidCascadeTab:
         self.new_run_btn = ctk.CTkButton(
             header,
             text="+ New Run",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=_font(13, "bold"),
             fg_color=self.COLORS['success'],
             hover_color="#1ea34b",
             width=120,
@@ -140,29 +178,42 @@ class VoidCascadeTab:
         self.run_panel.grid_columnconfigure(0, weight=1)
         self.run_panel.grid_rowconfigure(2, weight=1)
         
-        self._show_empty_state()
-    
-    def _clear_run_panel(self):
-        """Clear the run panel contents."""
-        for widget in self.run_panel.winfo_children():
-            widget.destroy()
-    
-    def _show_empty_state(self):
-        """Show empty state when no run is active."""
-        self._clear_run_panel()
-        
-        empty = ctk.CTkLabel(
+        # Built once; shown/hidden rather than recreated between runs
+        self._active_run_widgets = []  # filled by _build_active_run_widgets()
+        self._empty_label = ctk.CTkLabel(
             self.run_panel,
             text="⚡\n\nClick '+ New Run' to start tracking drops\n\nView past runs in the History tab",
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             text_color=self.COLORS['text_muted'],
             justify="center"
         )
-        empty.place(relx=0.5, rely=0.5, anchor="center")
+        
+        self._show_empty_state()
+    
+    def _show_empty_state(self):
+        """Show empty state when no run is active."""
+        for widget in self._active_run_widgets:
+            widget.grid_remove()
+        if self._active_run_widgets:
+            self.suggestions_frame.grid_remove()
+        self._empty_label.place(relx=0.5, rely=0.5, anchor="center")
     
     def _show_active_run(self):
-        """Show the active run interface for logging drops."""
-        self._clear_run_panel()
+        """Show the active run interface for logging drops, resetting it for the new run."""
+        if not self._active_run_widgets:
+            self._build_active_run_widgets()
+        self._empty_label.place_forget()
+        for widget in self._active_run_widgets:
+            widget.grid()
+        
+        self.run_title_var.set(f"Run {len(self.run_history) + 1}")
+        self.search_var.set("")
+        self.suggestions_frame.grid_remove()
+        self._search_entry.focus()
+        self._refresh_drops_list()
+    
+    def _build_active_run_widgets(self):
+        """Create the active run interface once; later runs reuse it."""
         self.run_panel.grid_rowconfigure(2, weight=0)
         self.run_panel.grid_rowconfigure(3, weight=1)
         
@@ -172,11 +223,11 @@ class VoidCascadeTab:
         header.grid_columnconfigure(1, weight=1)
         
         # Run title (editable)
-        self.run_title_var = ctk.StringVar(value=f"Run {len(self.run_history) + 1}")
+        self.run_title_var = ctk.StringVar()
         self.title_entry = ctk.CTkEntry(
             header,
             textvariable=self.run_title_var,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=_font(16, "bold"),
             fg_color=self.COLORS['bg_card'],
             border_width=0,
             width=200,
@@ -188,7 +239,7 @@ class VoidCascadeTab:
         end_btn = ctk.CTkButton(
             header,
             text="✓ Finish Run",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=_font(13, "bold"),
             fg_color=self.COLORS['accent'],
             hover_color=self.COLORS['accent_hover'],
             width=110,
@@ -201,7 +252,7 @@ class VoidCascadeTab:
         cancel_btn = ctk.CTkButton(
             header,
             text="✕",
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             fg_color=self.COLORS['bg_card'],
             hover_color=self.COLORS['error'],
             width=36,
@@ -221,7 +272,7 @@ class VoidCascadeTab:
             add_frame,
             textvariable=self.search_var,
             placeholder_text="🔍 Type to add a drop (e.g., 'Paris Prime Grip')...",
-            font=ctk.CTkFont(size=13),
+            font=_font(13),
             fg_color="transparent",
             border_width=0,
             height=44
@@ -229,12 +280,14 @@ class VoidCascadeTab:
         search.grid(row=0, column=0, sticky="ew", padx=15, pady=10)
         search.bind("<KeyRelease>", self._on_search)
         search.bind("<Return>", self._on_enter)
-        search.focus()
+        self._search_entry = search
         
         # Suggestions frame (hidden until search)
         self.suggestions_frame = ctk.CTkFrame(self.run_panel, fg_color=self.COLORS['bg_card'], corner_radius=8)
         self.suggestions_frame.grid(row=2, column=0, sticky="new", padx=20)
         self.suggestions_frame.grid_remove()
+        self._suggestion_pool = []  # Buttons reused across searches
+        self._suggestions_shown = 0
         
         # Setup treeview style for drops
         self._setup_drops_treeview_style()
@@ -301,7 +354,7 @@ class VoidCascadeTab:
         self.gsb_label = ctk.CTkButton(
             totals_inner,
             text="",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
             fg_color="transparent",
             hover_color=self.COLORS['bg_hover'],
             text_color=self.COLORS['accent'],
@@ -315,14 +368,14 @@ class VoidCascadeTab:
         self.totals_label = ctk.CTkLabel(
             totals_inner,
             text="0 drops  •  0p  •  0 ducats",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
             text_color=self.COLORS['text']
         )
         self.totals_label.pack(side="left")
         
         self._current_gsb = ""  # Store current GSB string
         
-        self._refresh_drops_list()
+        self._active_run_widgets = [header, add_frame, drops_container, totals]
     
     def _setup_drops_treeview_style(self):
         """Setup ttk style for drops treeview."""
@@ -397,7 +450,7 @@ class VoidCascadeTab:
             self.drops_tree.insert("", "end", values=("No drops yet - search above to add", "", "", "", ""), tags=('evenrow',))
         else:
             # Sort by rarity: Rare -> Uncommon -> Common -> Forma
-            rarity_order = {'Rare': 0, 'Uncommon': 1, 'Common': 2, 'Forma Blueprint': 3}
+            rarity_order = self.RARITY_ORDER
             sorted_drops = sorted(
                 self.current_run_drops.items(),
                 key=lambda x: (rarity_order.get(x[1]['rarity'], 2), x[0])
@@ -410,12 +463,7 @@ class VoidCascadeTab:
                 qty = drop_data['qty']
                 
                 # Get rarity tag
-                rarity_tag = {
-                    'Rare': 'rare',
-                    'Uncommon': 'uncommon',
-                    'Common': 'common',
-                    'Forma Blueprint': 'forma'
-                }.get(rarity, 'common')
+                rarity_tag = self.RARITY_TAGS.get(rarity, 'common')
                 
                 # Row color tag
                 row_tag = 'evenrow' if i % 2 == 0 else 'oddrow'
@@ -436,19 +484,28 @@ class VoidCascadeTab:
         
         self._update_totals()
     
+    def _run_totals(self):
+        """Return (drops, plat, ducats, qty per rarity) for the current run in one pass."""
+        count = total_plat = total_ducats = 0
+        rarity_counts = dict.fromkeys(self.RARITY_COLORS, 0)
+        for d in self.current_run_drops.values():
+            qty = d['qty']
+            count += qty
+            total_plat += d['plat'] * qty
+            total_ducats += d['ducats'] * qty
+            if d['rarity'] in rarity_counts:
+                rarity_counts[d['rarity']] += qty
+        return count, total_plat, total_ducats, rarity_counts
+    
     def _update_totals(self):
         """Update the totals display with rarity counters."""
         if not hasattr(self, 'totals_label'):
             return
         
-        total_plat = sum(d['plat'] * d['qty'] for d in self.current_run_drops.values())
-        total_ducats = sum(d['ducats'] * d['qty'] for d in self.current_run_drops.values())
-        count = sum(d['qty'] for d in self.current_run_drops.values())
-        
-        # Count by rarity
-        gold = sum(d['qty'] for d in self.current_run_drops.values() if d['rarity'] == 'Rare')
-        silver = sum(d['qty'] for d in self.current_run_drops.values() if d['rarity'] == 'Uncommon')
-        bronze = sum(d['qty'] for d in self.current_run_drops.values() if d['rarity'] == 'Common')
+        count, total_plat, total_ducats, rarity_counts = self._run_totals()
+        gold = rarity_counts['Rare']
+        silver = rarity_counts['Uncommon']
+        bronze = rarity_counts['Common']
         
         # Build rarity counter string
         rarity_parts = []
@@ -489,51 +546,48 @@ class VoidCascadeTab:
             return
         
         # Find matches
-        matches = []
-        seen = set()
-        for item_name, rarity in self._all_items:
-            if query in item_name.lower() and item_name not in seen:
-                matches.append((item_name, rarity))
-                seen.add(item_name)
+        matches = [(item_name, rarity) for lowered, item_name, rarity in self._search_items if query in lowered]
         
         # Sort by rarity: Rare -> Uncommon -> Common -> Forma
-        rarity_order = {'Rare': 0, 'Uncommon': 1, 'Common': 2, 'Forma Blueprint': 3}
+        rarity_order = self.RARITY_ORDER
         matches.sort(key=lambda x: (rarity_order.get(x[1], 2), x[0]))
         matches = matches[:8]  # Limit after sorting
         
-        # Clear old suggestions
-        for widget in self.suggestions_frame.winfo_children():
-            widget.destroy()
+        # Refill the pooled buttons; hide the ones not needed this time
+        for i, (name, rarity) in enumerate(matches):
+            self._show_suggestion(name, rarity, i)
+        for btn in self._suggestion_pool[len(matches):self._suggestions_shown]:
+            btn.pack_forget()
+        self._suggestions_shown = len(matches)
         
         if matches:
             self.suggestions_frame.grid()
-            for i, (name, rarity) in enumerate(matches):
-                self._create_suggestion(name, rarity, i)
         else:
             self.suggestions_frame.grid_remove()
     
-    def _create_suggestion(self, item_name, rarity, index):
-        """Create a suggestion button."""
-        rarity_colors = {
-            'Common': '#cd7f32',
-            'Uncommon': '#c0c0c0',
-            'Rare': '#ffd700',
-            'Forma Blueprint': '#60a5fa'
-        }
-        color = rarity_colors.get(rarity, self.COLORS['text'])
-        
-        btn = ctk.CTkButton(
-            self.suggestions_frame,
-            text=f"● {item_name}",
-            font=ctk.CTkFont(size=12),
-            text_color=color,
-            fg_color="transparent",
-            hover_color=self.COLORS['bg_hover'],
-            anchor="w",
-            height=36,
-            command=lambda: self._add_drop(item_name, rarity)
-        )
-        btn.pack(fill="x", padx=5, pady=2)
+    def _show_suggestion(self, item_name, rarity, index):
+        """Show a suggestion in the button at index, creating the button if needed."""
+        color = self.RARITY_COLORS.get(rarity, self.COLORS['text'])
+        
+        if index < len(self._suggestion_pool):
+            btn = self._suggestion_pool[index]
+            btn.configure(text=f"● {item_name}", text_color=color,
+                          command=lambda: self._add_drop(item_name, rarity))
+        else:
+            btn = ctk.CTkButton(
+                self.suggestions_frame,
+                text=f"● {item_name}",
+                font=_font(12),
+                text_color=color,
+                fg_color="transparent",
+                hover_color=self.COLORS['bg_hover'],
+                anchor="w",
+                height=36,
+                command=lambda: self._add_drop(item_name, rarity)
+            )
+            self._suggestion_pool.append(btn)
+        if index >= self._suggestions_shown:
+            btn.pack(fill="x", padx=5, pady=2)
     
     def _on_enter(self, event):
         """Handle Enter key - add first suggestion."""
@@ -541,8 +595,8 @@ class VoidCascadeTab:
         if not query:
             return
         
-        for item_name, rarity in self._all_items:
-            if query in item_name.lower():
+        for lowered, item_name, rarity in self._search_items:
+            if query in lowered:
                 self._add_drop(item_name, rarity)
                 break
     
@@ -598,16 +652,8 @@ class VoidCascadeTab:
         if not self.run_active:
             return
         
-        # Calculate totals
-        total_drops = sum(d['qty'] for d in self.current_run_drops.values())
-        total_plat = sum(d['plat'] * d['qty'] for d in self.current_run_drops.values())
-        total_ducats = sum(d['ducats'] * d['qty'] for d in self.current_run_drops.values())
-        
-        # Count by rarity
-        gold = sum(d['qty'] for d in self.current_run_drops.values() if d['rarity'] == 'Rare')
-        silver = sum(d['qty'] for d in self.current_run_drops.values() if d['rarity'] == 'Uncommon')
-        bronze = sum(d['qty'] for d in self.current_run_drops.values() if d['rarity'] == 'Common')
-        forma = sum(d['qty'] for d in self.current_run_drops.values() if d['rarity'] == 'Forma Blueprint')
+        # Calculate totals and rarity counts
+        total_drops, total_plat, total_ducats, rarity_counts = self._run_totals()
         
         # Create preview dialog
         dialog = ctk.CTkToplevel(self.app)
@@ -627,7 +673,7 @@ class VoidCascadeTab:
         title = ctk.CTkLabel(
             dialog,
             text="⚡ Run Complete!",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=_font(20, "bold"),
             text_color=self.COLORS['text']
         )
         title.pack(pady=(20, 5))
@@ -637,7 +683,7 @@ class VoidCascadeTab:
         name_lbl = ctk.CTkLabel(
             dialog,
             text=run_name,
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             text_color=self.COLORS['text_secondary']
         )
         name_lbl.pack(pady=(0, 15))
@@ -654,13 +700,13 @@ class VoidCascadeTab:
         ctk.CTkLabel(
             big_row,
             text=f"{total_drops}",
-            font=ctk.CTkFont(size=28, weight="bold"),
+            font=_font(28, "bold"),
             text_color=self.COLORS['text']
         ).pack(side="left", padx=15)
         ctk.CTkLabel(
             big_row,
             text="drops",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             text_color=self.COLORS['text_muted']
         ).pack(side="left", padx=(0, 20))
         
@@ -668,7 +714,7 @@ class VoidCascadeTab:
         ctk.CTkLabel(
             big_row,
             text=f"{total_plat}p",
-            font=ctk.CTkFont(size=28, weight="bold"),
+            font=_font(28, "bold"),
             text_color="#60a5fa"
         ).pack(side="left", padx=15)
         
@@ -676,7 +722,7 @@ class VoidCascadeTab:
         ctk.CTkLabel(
             big_row,
             text=f"{total_ducats}d",
-            font=ctk.CTkFont(size=28, weight="bold"),
+            font=_font(28, "bold"),
             text_color="#fbbf24"
         ).pack(side="left", padx=15)
         
@@ -684,34 +730,15 @@ class VoidCascadeTab:
         rarity_row = ctk.CTkFrame(stats_frame, fg_color="transparent")
         rarity_row.pack(pady=(0, 15))
         
-        if gold > 0:
-            ctk.CTkLabel(
-                rarity_row,
-                text=f"🥇 {gold}",
-                font=ctk.CTkFont(size=14),
-                text_color="#ffd700"
-            ).pack(side="left", padx=10)
-        if silver > 0:
-            ctk.CTkLabel(
-                rarity_row,
-                text=f"🥈 {silver}",
-                font=ctk.CTkFont(size=14),
-                text_color="#c0c0c0"
-            ).pack(side="left", padx=10)
-        if bronze > 0:
-            ctk.CTkLabel(
-                rarity_row,
-                text=f"🥉 {bronze}",
-                font=ctk.CTkFont(size=14),
-                text_color="#cd7f32"
-            ).pack(side="left", padx=10)
-        if forma > 0:
-            ctk.CTkLabel(
-                rarity_row,
-                text=f"⚙ {forma}",
-                font=ctk.CTkFont(size=14),
-                text_color="#60a5fa"
-            ).pack(side="left", padx=10)
+        for rarity, icon in _RARITY_BADGES:
+            count = rarity_counts[rarity]
+            if count > 0:
+                ctk.CTkLabel(
+                    rarity_row,
+                    text=f"{icon} {count}",
+                    font=_font(14),
+                    text_color=self.RARITY_COLORS[rarity]
+                ).pack(side="left", padx=10)
         
         # Buttons
         btn_frame = ctk.CTkFrame(dialog, fg_color="transparent")
@@ -727,7 +754,7 @@ class VoidCascadeTab:
         save_btn = ctk.CTkButton(
             btn_frame,
             text="💾 Save Run",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
             fg_color=self.COLORS['success'],
             hover_color="#1ea34b",
             width=130,
@@ -739,7 +766,7 @@ class VoidCascadeTab:
         back_btn = ctk.CTkButton(
             btn_frame,
             text="← Back",
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             fg_color=self.COLORS['bg_card'],
             hover_color=self.COLORS['bg_hover'],
             text_color=self.COLORS['text_secondary'],
@@ -792,7 +819,6 @@ class VoidCascadeTab:
     
     def cancel_run(self):
         """Cancel the current run without saving."""
-        from tkinter import messagebox
         if self.current_run_drops:
             if not messagebox.askyesno("Cancel Run", "Discard this run without saving?"):
                 return
@@ -0,0 +1,12 @@
+"""
+Shared fonts for the Warframe Relic Companion UI.
+"""
+
+from functools import lru_cache
+import customtkinter as ctk
+
+
+@lru_cache(maxsize=None)
+def get_font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """Return the app-wide CTkFont for (size, weight), creating it on first use."""
+    return ctk.CTkFont(size=size, weight=weight)